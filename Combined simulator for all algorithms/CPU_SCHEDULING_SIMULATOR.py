@@ -1,11 +1,45 @@
 #!/usr/bin/env python3
+import heapq
+import mmap
 import random
+import struct
 import sys
+from array import array
+
+VERBOSE = '--verbose' in sys.argv[1:]
+
+# same layout as "GUI files/tracefile.py": header, then int64 pid/arrival/burst columns
+WORKLOAD_MAGIC = b'SCHEDWL\x00'
+WORKLOAD_HEADER = struct.Struct('<8sIIQQ')
+
+def loadWorkload(path):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if len(mapped) < WORKLOAD_HEADER.size:
+            raise ValueError(f"{path} is not a valid binary workload file")
+        magic, version, _, count, _ = WORKLOAD_HEADER.unpack_from(mapped)
+        if magic != WORKLOAD_MAGIC or version != 1 or len(mapped) != WORKLOAD_HEADER.size + 24 * count:
+            raise ValueError(f"{path} is not a valid binary workload file")
+        view = memoryview(mapped)[WORKLOAD_HEADER.size:]
+        if sys.byteorder == 'little':
+            columns = view.cast('q')
+        else:
+            # array('q', view) would widen each byte into its own item
+            columns = array('q')
+            columns.frombytes(view)
+            columns.byteswap()
+        processes = [{'pid': pid, 'arrival': arrival, 'burst': burst}
+                     for pid, arrival, burst in zip(columns[:count], columns[count:2 * count], columns[2 * count:])]
+        del columns
+        view.release()
+    return processes
 
 def makeProcess():
     processes = []
-    inputChoice = input("Do you want a [M]ANUAL or [R]ANDOM process generation? [M/R]: ").strip().upper()
-    if inputChoice == 'M':
+    inputChoice = input("Do you want a [M]ANUAL, [R]ANDOM or [F]ILE process generation? [M/R/F]: ").strip().upper()
+    if inputChoice == 'F':
+        path = input("Path to binary workload file: ").strip()
+        processes = loadWorkload(path)
+    elif inputChoice == 'M':
         n = int(input("Input number of processes: "))
         for i in range(1, n + 1):
             arrival = int(input(f"  Arrival time of P{i}: "))
@@ -128,56 +162,56 @@ def sjf(processes):
     return events, stats
 
 def srtf(processes):
+    order = sorted(processes, key=lambda p: p['arrival'])
+    n = len(order)
     time = 0
     events = []
     stats = {}
     ready = []
-    remaining = {p['pid']: p['burst'] for p in processes}
-    arrived = []
+    arrivalIndex = 0
     currentProcess = None
     lastSwitch = 0
-    finished = 0
-    n = len(processes)
 
-    while finished < n:
-        for p in processes:
-            if p['arrival'] == time:
-                arrived.append(p)
+    while arrivalIndex < n or ready or currentProcess is not None:
+        while arrivalIndex < n and order[arrivalIndex]['arrival'] <= time:
+            p = order[arrivalIndex]
+            heapq.heappush(ready, (p['burst'], p['arrival'], p['pid'], arrivalIndex))
+            arrivalIndex += 1
 
-        ready += [p for p in arrived if p['pid'] not in [r['pid'] for r in ready]]
-        ready = [p for p in ready if remaining[p['pid']] > 0]
+        if currentProcess is None and not ready:
+            time = order[arrivalIndex]['arrival']
+            continue
 
-        if ready:
-            ready.sort(key=lambda p: (remaining[p['pid']], p['arrival'], p['pid']))
-            nextProcess = ready[0]
-
-            if currentProcess is None or currentProcess['pid'] != nextProcess['pid']:
-                if currentProcess:
-                    events.append((lastSwitch, time, f"P{currentProcess['pid']}"))
-                currentProcess = nextProcess
-                lastSwitch = time
-
-                if 'startTime' not in stats.get(currentProcess['pid'], {}):
-                    if currentProcess['pid'] not in stats:
-                        stats[currentProcess['pid']] = {
-                            'arrival': currentProcess['arrival'],
-                            'burst': currentProcess['burst']
-                        }
-                    stats[currentProcess['pid']]['startTime'] = time
-
-            remaining[currentProcess['pid']] -= 1
-            time += 1
+        if currentProcess is not None:
+            heapq.heappush(ready, currentProcess)
+        burstLeft, arrival, pid, index = heapq.heappop(ready)
+
+        if currentProcess is None or currentProcess[2] != pid:
+            if currentProcess is not None:
+                events.append((lastSwitch, time, f"P{currentProcess[2]}"))
+            lastSwitch = time
+
+            if pid not in stats:
+                stats[pid] = {
+                    'arrival': arrival,
+                    'burst': order[index]['burst'],
+                    'startTime': time
+                }
+
+        if arrivalIndex < n and time + burstLeft > order[arrivalIndex]['arrival']:
+            nextArrival = order[arrivalIndex]['arrival']
+            currentProcess = (burstLeft - (nextArrival - time), arrival, pid, index)
+            time = nextArrival
+            continue
 
-            if remaining[currentProcess['pid']] == 0:
-                events.append((lastSwitch, time, f"P{currentProcess['pid']}"))
-                stats[currentProcess['pid']]['completeTime'] = time
-                stats[currentProcess['pid']]['turnaround'] = time - currentProcess['arrival']
-                stats[currentProcess['pid']]['response'] = stats[currentProcess['pid']]['startTime'] - currentProcess['arrival']
-                print(f"P{currentProcess['pid']}: ST={stats[currentProcess['pid']]['startTime']}, CT={time}, AT={currentProcess['arrival']}, RT={stats[currentProcess['pid']]['response']}, TAT={stats[currentProcess['pid']]['turnaround']}")
-                finished += 1
-                currentProcess = None
-        else:
-            time += 1
+        time += burstLeft
+        events.append((lastSwitch, time, f"P{pid}"))
+        stats[pid]['completeTime'] = time
+        stats[pid]['turnaround'] = time - arrival
+        stats[pid]['response'] = stats[pid]['startTime'] - arrival
+        if VERBOSE:
+            print(f"P{pid}: ST={stats[pid]['startTime']}, CT={time}, AT={arrival}, RT={stats[pid]['response']}, TAT={stats[pid]['turnaround']}")
+        currentProcess = None
 
     return events, stats
 
@@ -239,13 +273,14 @@ def rr(processes):
             stats[pid]['completeTime'] = time
             stats[pid]['turnaround'] = time - arrival
             stats[pid]['response'] = stats[pid]['startTime'] - arrival
-            print(f"\nProcess P{pid} finished:")
-            print(f"  Arrival Time   : {arrival}")
-            print(f"  Burst Time     : {current['burst']}")
-            print(f"  Start Time     : {stats[pid]['startTime']}")
-            print(f"  Completion Time: {time}")
-            print(f"  Turnaround Time: {stats[pid]['turnaround']}")
-            print(f"  Response Time  : {stats[pid]['response']}\n")
+            if VERBOSE:
+                print(f"\nProcess P{pid} finished:")
+                print(f"  Arrival Time   : {arrival}")
+                print(f"  Burst Time     : {current['burst']}")
+                print(f"  Start Time     : {stats[pid]['startTime']}")
+                print(f"  Completion Time: {time}")
+                print(f"  Turnaround Time: {stats[pid]['turnaround']}")
+                print(f"  Response Time  : {stats[pid]['response']}\n")
             finished += 1
 
     return events, stats
@@ -328,13 +363,14 @@ def mlfq(processes):
             stats[pid]['completeTime'] = time
             stats[pid]['turnaround'] = time - arrival
             stats[pid]['response'] = stats[pid]['startTime'] - arrival
-            print(f"Process P{pid} finished:")
-            print(f"  Arrival Time   : {arrival}")
-            print(f"  Burst Time     : {origBurst[pid]}")
-            print(f"  Start Time     : {stats[pid]['startTime']}")
-            print(f"  Completion Time: {time}")
-            print(f"  Turnaround Time: {stats[pid]['turnaround']}")
-            print(f"  Response Time  : {stats[pid]['response']}\n")
+            if VERBOSE:
+                print(f"Process P{pid} finished:")
+                print(f"  Arrival Time   : {arrival}")
+                print(f"  Burst Time     : {origBurst[pid]}")
+                print(f"  Start Time     : {stats[pid]['startTime']}")
+                print(f"  Completion Time: {time}")
+                print(f"  Turnaround Time: {stats[pid]['turnaround']}")
+                print(f"  Response Time  : {stats[pid]['response']}\n")
             finished += 1
 
     return events, stats
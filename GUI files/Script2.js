@@ -99,27 +99,6 @@ function runScheduler() {
         url += `&quantum=0`; 
     }
 
-    fetch(url)
-        .then(res => res.json())
-        .then(data => {
-            updateResultsTable(data.stats);
-            drawGanttChart(data.events);
-            displayAverageMetrics(data.averageMetrics);
-
-            const quantumInfo = document.getElementById('quantumInfo');
-            const allotmentInfo = document.getElementById('allotmentInfo'); 
-
-            if (algorithm == RR) {
-                quantumInfo.innerText = `Quantum Time Slice: ${quantum}`;
-                timeSlice.innerText = '';
-            } else if (algorithm == MLFQ) {
-                quantumInfo.innerText = `Quantum Time Slice: ${quantum}`;
-                allotmentInfo.innerText = `Allotment Time: ${allotment}`;
-            }
-
-        });
-
-
     fetch(url)
         .then(res => res.json())
         .then(data => {
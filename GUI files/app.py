@@ -1,9 +1,54 @@
+import json
+import time
 from queue import Empty
-from flask import Flask, render_template, request, jsonify
-from scheduler import fifo, sjf, srtf, rr, mlfq
+from flask import Flask, Response, g, render_template, request, jsonify
+from engines import ALGORITHMS, stream
+from generator import ARRIVALS, BURSTS, generate
+from compare import compare
+from cache import ResultCache, result_key
+from counters import COUNTERS, Histogram, exposition
+from incremental import IncrementalRun
+from ingest import FORMATS, PARSERS, TooManyRows, ingest
+from profiling import profile_run, profile_stacks
+from sessions import PROCESS_BYTES, SESSIONS, SessionFull
+from tracing import LEVELS, TRACE
+import metrics
+from workload import ProcessTable
+from workload import INT64_MAX, INT64_MIN
 
 app = Flask(__name__)
-process_list = []
+# results are keyed by workload digest, so one cache serves every session
+results = ResultCache()
+latency = Histogram()
+SESSION_COOKIE = 'scheduler_session'
+SESSION_HEADER = 'X-Session-Id'
+
+@app.before_request
+def start_timer():
+    g.started = time.perf_counter()
+
+@app.after_request
+def observe_latency(response):
+    handler = request.url_rule.rule if request.url_rule else 'unmatched'
+    latency.observe((('handler', handler), ('method', request.method)), time.perf_counter() - g.started)
+    session = g.get('session')
+    if session is not None:
+        if g.newSession:
+            response.set_cookie(SESSION_COOKIE, session.id, httponly=True, samesite='Lax')
+        response.headers[SESSION_HEADER] = session.id
+    return response
+
+def current_session(create=True):
+    # resolved on first use, so scrapes and cookieless reads never mint sessions
+    # (or push real ones out of the LRU)
+    if g.get('session') is None and (create or 'session' not in g):
+        sessionId = request.headers.get(SESSION_HEADER) or request.cookies.get(SESSION_COOKIE)
+        g.session, g.newSession = SESSIONS.get(sessionId, create)
+    return g.session
+
+def workload_snapshot():
+    session = current_session(create=False)
+    return session.snapshot() if session is not None else ProcessTable()
 
 @app.route('/')
 def index():
@@ -12,95 +57,336 @@ def index():
 @app.route('/add_process', methods=['POST'])
 def add_process():
     data = request.get_json()
-    print("Received data from frontend:", data) 
+    if TRACE.debug:
+        TRACE.emit('debug', 'add_process request', data=data)
 
     try:
         arrival = int(data.get('arrival'))
         burst = int(data.get('burst'))
+        if not (INT64_MIN <= arrival <= INT64_MAX and INT64_MIN <= burst <= INT64_MAX):
+            raise ValueError("arrival and burst must fit in a 64-bit integer")
     except (TypeError, ValueError) as e:
-        print("Error parsing arrival/burst:", e)
+        if TRACE.warning:
+            TRACE.emit('warning', 'invalid arrival/burst', error=str(e))
         return jsonify({'status': 'error', 'message': 'Invalid input'}), 400
 
-    process = {
-        'pid': len(process_list) + 1,
-        'arrival': arrival,
-        'burst': burst
-    }
-    process_list.append(process)
-    print("Updated process list:", process_list)  
+    session = current_session()
+    with session.lock:
+        try:
+            count, version = session.add((arrival,), (burst,))
+        except SessionFull as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 413
+        processes = session.processes.to_dicts()
+    if TRACE.info:
+        TRACE.emit('info', 'process added', session=session.id, pid=count, arrival=arrival, burst=burst,
+                   processes=count)
 
-    return jsonify({'status': 'success', 'processes': process_list})
+    return jsonify({'status': 'success', 'processes': processes, 'version': version})
 
-conditions = {
-    'quantum': None,
-    'allotment': None
-}
+@app.route('/add_processes', methods=['POST'])
+def add_processes():
+    fmt = request.args.get('format') or FORMATS.get(request.mimetype)
+    if fmt not in PARSERS:
+        return jsonify({'status': 'error', 'message': 'Unsupported format; use JSON, NDJSON or CSV'}), 400
+
+    # stop reading once the body can no longer fit in the session
+    session = current_session()
+    try:
+        arrivals, bursts, errors, errorCount = ingest(request.stream, fmt, maxRows=session.room())
+    except TooManyRows as e:
+        return jsonify({'status': 'error', 'message': f"session workload limit exceeded: {e}"}), 413
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    # rows are all-or-nothing unless the caller opts into skipping bad ones
+    if errorCount and not flag('partial'):
+        return jsonify({'status': 'error', 'message': 'Invalid rows', 'errorCount': errorCount,
+                        'errors': errors}), 400
+
+    try:
+        count, version = session.add(arrivals, bursts)
+    except SessionFull as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 413
+    if TRACE.info:
+        TRACE.emit('info', 'processes added', session=session.id, format=fmt, added=len(arrivals),
+                   rejected=errorCount, processes=count)
+
+    return jsonify({'status': 'success', 'added': len(arrivals), 'processes': count,
+                    'version': version, 'errorCount': errorCount, 'errors': errors})
 
 @app.route('/set_conditions', methods=['POST'])
 def set_conditions():
-    global conditions
     data = request.get_json()
-    print("Received conditions:", data)
+    if TRACE.debug:
+        TRACE.emit('debug', 'set_conditions request', data=data)
 
     try:
         quantum = int(data.get('quantum', 1))
         allotment = int(data.get('allotment', 1))
-        conditions['quantum'] = quantum
-        conditions['allotment'] = allotment
+        current_session().set_conditions(quantum, allotment)
         return jsonify({'message': 'Quantum and Allotment set successfully'})
     except (TypeError, ValueError) as e:
-        print("Error setting conditions:", e)
+        if TRACE.warning:
+            TRACE.emit('warning', 'invalid conditions', error=str(e))
         return jsonify({'error': 'Invalid quantum or allotment'}), 400
     
 
+def parse_levels(values):
+    return [int(v) for value in values for v in value.split(',') if v.strip()]
+
+
+def flag(name):
+    return request.args.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def scheduler_args(algorithm):
+    if algorithm == 'RR':
+        levels = parse_levels([request.args.get('quantum', '2')])
+        if not levels or levels[0] < 1:
+            raise ValueError(levels)
+        return (levels[0],)
+    if algorithm == 'MLFQ':
+        quantums = parse_levels(request.args.getlist('quantum') or ['2'])
+        allotment = parse_levels(request.args.getlist('allotment') or ['1'])
+        total_queues = int(request.args.get('queues', max(4, len(quantums), len(allotment))))
+        boost = int(request.args.get('boost', 0)) or None
+        if not quantums or not allotment or total_queues < 1 or min(quantums + allotment) < 1 \
+                or (boost is not None and boost < 1):
+            raise ValueError(request.args)
+        quantums = (quantums + [quantums[-1]] * total_queues)[:total_queues]
+        allotment = (allotment + [allotment[-1]] * total_queues)[:total_queues]
+        return (quantums, allotment, boost)
+    return ()
+
+
+def render_result(table, algorithm, args, metricsOnly, incrementalRuns):
+    if metricsOnly:
+        with COUNTERS.phase(algorithm, 'simulate'):
+            stats, averageMetrics = metrics.ALGORITHMS[algorithm](table, *args)
+        with COUNTERS.phase(algorithm, 'serialize'):
+            return app.json.dumps({'events': [], 'stats': stats, 'averageMetrics': averageMetrics})
+
+    with COUNTERS.phase(algorithm, 'simulate'):
+        if algorithm in incrementalRuns:
+            events, stats, averageMetrics = incrementalRuns[algorithm].run(table)
+        else:
+            events, stats, averageMetrics = ALGORITHMS[algorithm](table, *args)
+
+    if TRACE.info:
+        TRACE.emit('info', 'scheduler run', algorithm=algorithm, segments=len(events), processes=len(stats),
+                   averageMetrics=averageMetrics)
+
+    with COUNTERS.phase(algorithm, 'serialize'):
+        return app.json.dumps({'events': events.to_list(), 'stats': stats , 'averageMetrics' : averageMetrics})
+
+
 @app.route('/run_scheduler', methods=['GET'])
 def run_scheduler():
-    global process_list
     algorithm = request.args.get('algorithm')
-    print("Running scheduler with algorithm:", algorithm) 
-
-    if algorithm == 'FIFO':
-        events, stats, averageMetrics = fifo(process_list)
-    elif algorithm == 'SJF':
-        events, stats, averageMetrics = sjf(process_list)
-    elif algorithm == 'SRTF':
-        events, stats, averageMetrics = srtf(process_list)
-    elif algorithm == 'RR':
-        quantum = int(request.args.get('quantum', 2))
-        events, stats, averageMetrics = rr(process_list, quantum)
-    elif algorithm == 'MLFQ':
-         q = int(request.args.get('quantum', 2)) 
-         a = int(request.args.get('allotment', 1))
-         total_queues = 4
-         quantums = [q] * total_queues
-         allotment = [a] * total_queues
-         events, stats, averageMetrics = mlfq(process_list, quantums, allotment)
-
-    else:
+    if TRACE.debug:
+        TRACE.emit('debug', 'run_scheduler request', algorithm=algorithm, args=request.args.to_dict())
+
+    if algorithm not in ALGORITHMS:
+        return jsonify({'error': 'Unknown algorithm'}), 400
+    try:
+        args = scheduler_args(algorithm)
+    except ValueError:
+        return jsonify({'error': 'Invalid quantum or allotment'}), 400
+
+    table = workload_snapshot()
+    if not len(table):
+        return jsonify({'error': 'No processes to schedule'}), 400
+
+    metricsOnly = flag('metrics_only')
+    key = result_key(table, algorithm, args, metricsOnly)
+    if request.if_none_match.contains_weak(key):
+        response = Response(status=304)
+        response.set_etag(key)
+        return response
+
+    body = results.get(key)
+    if body is None:
+        # other workers may already have run this workload
+        body = SESSIONS.get_run(key)
+        if body is None:
+            body = render_result(table, algorithm, args, metricsOnly, g.session.incremental)
+            SESSIONS.put_run(key, algorithm, len(table), body)
+        results.put(key, body)
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(key)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/profile', methods=['GET'])
+def profile():
+    algorithm = request.args.get('algorithm')
+    if algorithm not in ALGORITHMS:
+        return jsonify({'error': 'Unknown algorithm'}), 400
+    try:
+        args = scheduler_args(algorithm)
+        top = int(request.args.get('top', 25))
+    except ValueError:
+        return jsonify({'error': 'Invalid quantum, allotment or top'}), 400
+    table = workload_snapshot()
+    if not len(table):
+        return jsonify({'error': 'No processes to schedule'}), 400
+
+    metricsOnly = flag('metrics_only')
+
+    # FIFO/SJF get a throwaway incremental run so every pass simulates from scratch
+    def run():
+        runs = {algorithm: IncrementalRun(algorithm)} if algorithm in g.session.incremental else {}
+        return render_result(table, algorithm, args, metricsOnly, runs)
+
+    if request.args.get('format') == 'collapsed':
+        return Response(profile_stacks(run), mimetype='text/plain',
+                        headers={'Content-Disposition': f'attachment; filename={algorithm.lower()}.folded'})
+
+    report = profile_run(run, max(1, min(top, 200)))
+    report.update({'algorithm': algorithm, 'processes': len(table), 'metricsOnly': metricsOnly})
+    return jsonify(report)
+
+@app.route('/cache_stats', methods=['GET'])
+def cache_stats():
+    return jsonify(results.info())
+
+@app.route('/trace', methods=['GET'])
+def trace():
+    level = request.args.get('level')
+    try:
+        limit = int(request.args.get('limit', 0)) or None
+    except ValueError:
+        return jsonify({'error': 'Invalid limit'}), 400
+    if level is not None and level not in LEVELS:
+        return jsonify({'error': 'Unknown level'}), 400
+    return jsonify({'trace': TRACE.status(), 'records': TRACE.recent(limit, level)})
+
+@app.route('/trace', methods=['POST'])
+def configure_trace():
+    data = request.get_json(silent=True) or {}
+    try:
+        sample = float(data['sample']) if 'sample' in data else None
+        capacity = int(data['capacity']) if 'capacity' in data else None
+        TRACE.configure(data.get('level'), sample, capacity)
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    if data.get('clear'):
+        TRACE.clear()
+    return jsonify({'trace': TRACE.status()})
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    return Response(exposition(COUNTERS, latency, results.info()),
+                    content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/stream_scheduler', methods=['GET'])
+def stream_scheduler():
+    algorithm = request.args.get('algorithm')
+    if algorithm not in ALGORITHMS:
         return jsonify({'error': 'Unknown algorithm'}), 400
+    try:
+        args = scheduler_args(algorithm)
+    except ValueError:
+        return jsonify({'error': 'Invalid quantum or allotment'}), 400
+
+    table = workload_snapshot()
+    if not len(table):
+        return jsonify({'error': 'No processes to schedule'}), 400
 
-    print("Scheduler output - Events:", events)
-    print("Scheduler output - Stats:", stats)
-    print("Scheduler output - Average Metrics:", averageMetrics)
+    records = stream(algorithm, table, *args)
+    return Response((json.dumps(record) + '\n' for record in records), mimetype='application/x-ndjson')
 
-    return jsonify({'events': events, 'stats': stats , 'averageMetrics' : averageMetrics})
+@app.route('/compare', methods=['GET'])
+def compare_schedulers():
+    algorithms = [a.strip() for a in request.args.get('algorithms', ','.join(ALGORITHMS)).split(',') if a.strip()]
+    unknown = [a for a in algorithms if a not in ALGORITHMS]
+    if unknown or not algorithms:
+        return jsonify({'error': 'Unknown algorithm', 'algorithms': unknown}), 400
+    try:
+        jobs = {algorithm: scheduler_args(algorithm) for algorithm in algorithms}
+    except ValueError:
+        return jsonify({'error': 'Invalid quantum or allotment'}), 400
+    table = workload_snapshot()
+    if not len(table):
+        return jsonify({'error': 'No processes to schedule'}), 400
+
+    results, comparison = compare(table, jobs, flag('metrics_only'))
+    return jsonify({'results': results, 'comparison': comparison})
 
 @app.route('/clear', methods=['POST'])
 def clear():
-    global process_list
-    process_list = []
-    print("Process list cleared.")  
+    session = current_session(create=False)
+    if session is not None:
+        session.clear()
+        if TRACE.info:
+            TRACE.emit('info', 'process list cleared', session=session.id)
     return jsonify({'status': 'cleared'})
 
+@app.route('/session', methods=['GET'])
+def session_info():
+    session = current_session(create=False)
+    return jsonify({'session': session.info() if session is not None else None, 'store': SESSIONS.info()})
+
+@app.route('/session', methods=['DELETE'])
+def end_session():
+    session = current_session(create=False)
+    if session is not None:
+        SESSIONS.drop(session.id)
+        g.session = None
+    response = jsonify({'status': 'ended'})
+    response.delete_cookie(SESSION_COOKIE)
+    return response
+
 import random  
 
 @app.route('/generate_random', methods=['GET'])
 def generate_random():
     arrival = random.randint(0, 10)
     burst = random.randint(1, 10)
-    print(f"Generated random arrival: {arrival}, burst: {burst}")
+    if TRACE.debug:
+        TRACE.emit('debug', 'generated random process', arrival=arrival, burst=burst)
     return jsonify({'arrival': arrival, 'burst': burst})
 
+@app.route('/generate', methods=['POST'])
+def generate_processes():
+    data = request.get_json(silent=True) or {}
+    options = {}
+    try:
+        n = int(data.get('n', 10))
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        if n * PROCESS_BYTES > SESSIONS.maxBytes:
+            raise SessionFull(f"session workload limit is {SESSIONS.maxBytes // PROCESS_BYTES} processes")
+        arrival = data.get('arrival', 'poisson')
+        burst = data.get('burst', 'exponential')
+        if arrival not in ARRIVALS or burst not in BURSTS:
+            raise ValueError(f"arrival must be one of {ARRIVALS} and burst one of {BURSTS}")
+        for name in ('meanBurst', 'utilization', 'rate', 'sigma', 'alpha', 'burstiness'):
+            if data.get(name) is not None:
+                options[name] = float(data[name])
+        for name in ('seed', 'dwell'):
+            if data.get(name) is not None:
+                options[name] = int(data[name])
+        table, info = generate(n, arrival, burst, **options)
+    except SessionFull as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 413
+    except ImportError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 501
+    except (TypeError, ValueError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    session = current_session()
+    try:
+        count, version = session.add(table.arrival, table.burst, replace=flag('replace'))
+    except SessionFull as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 413
+    if TRACE.info:
+        TRACE.emit('info', 'processes generated', session=session.id, processes=count, generator=info)
+
+    return jsonify({'status': 'success', 'added': n, 'processes': count,
+                    'version': version, 'generator': info})
+
 
 @app.route('/extract_results', methods=['POST'])
 def extract_results():
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+import argparse
+import builtins
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import engines
+import metrics
+import scheduler
+from workload import ProcessTable
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CLI_PATH = os.path.join(HERE, '..', 'Combined simulator for all algorithms', 'CPU_SCHEDULING_SIMULATOR.py')
+
+ALGORITHMS = ('FIFO', 'SJF', 'SRTF', 'RR', 'MLFQ')
+TARGETS = ('reference', 'cli', 'engines', 'metrics')
+
+# the reference and CLI engines rescan the process list every dispatch (FIFO/SJF)
+# or every tick (SRTF/RR/MLFQ), except the CLI's SRTF, which jumps between arrivals
+# on a heap; cases estimated past these step counts would run for minutes, so they
+# are skipped and reported as such
+SLOW_TARGETS = ('reference', 'cli')
+WORK_LIMITS = {
+    'FIFO': 4_000_000,
+    'SJF': 4_000_000,
+    'SRTF': 10_000_000,
+    'RR': 300_000,
+    'MLFQ': 10_000_000
+}
+# every engine emits one segment per time slice, so RR/MLFQ cases past this many
+# slices are skipped for all targets
+SLICE_LIMIT = 5_000_000
+
+
+def make_workload(shape, n, seed):
+    rng = random.Random(seed)
+    if shape == 'dense':
+        arrivals = [rng.randint(0, max(1, n // 4)) for _ in range(n)]
+        bursts = [rng.randint(1, 10) for _ in range(n)]
+    elif shape == 'sparse':
+        arrivals, t = [], 0
+        for _ in range(n):
+            t += rng.randint(20, 200)
+            arrivals.append(t)
+        bursts = [rng.randint(1, 10) for _ in range(n)]
+    elif shape == 'huge':
+        arrivals = [rng.randint(0, n * 1000) for _ in range(n)]
+        bursts = [rng.randint(100_000, 1_000_000) for _ in range(n)]
+    elif shape == 'tiny-quantum':
+        arrivals = [rng.randint(0, n * 10) for _ in range(n)]
+        bursts = [rng.randint(50, 200) for _ in range(n)]
+    else:
+        raise ValueError(f"unknown shape {shape}")
+    return ProcessTable(range(1, n + 1), arrivals, bursts)
+
+
+SHAPES = ('dense', 'sparse', 'huge', 'tiny-quantum')
+
+
+def shape_params(shape):
+    quantum = {'tiny-quantum': 1, 'huge': 50_000}.get(shape, 4)
+    return {
+        'quantum': quantum,
+        'quantums': [quantum, quantum * 2, quantum * 4, quantum * 8],
+        'allotments': [quantum * 2, quantum * 4, quantum * 8, quantum * 16]
+    }
+
+
+def load_cli():
+    spec = importlib.util.spec_from_file_location('cpu_scheduling_simulator', CLI_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def scripted_input(answers):
+    answers = iter(answers)
+    original = builtins.input
+    builtins.input = lambda prompt='': next(answers)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original
+
+
+def make_case(target, algorithm, table, params, cli):
+    quantum, quantums, allotments = params['quantum'], params['quantums'], params['allotments']
+
+    if target == 'engines':
+        args = {'RR': (quantum,), 'MLFQ': (quantums, allotments)}.get(algorithm, ())
+        return lambda: engines.ALGORITHMS[algorithm](table, *args)[0]
+    if target == 'metrics':
+        args = {'RR': (quantum,), 'MLFQ': (quantums, allotments)}.get(algorithm, ())
+        return lambda: metrics.ALGORITHMS[algorithm](table, *args) and None
+
+    processes = table.to_dicts()
+    if target == 'reference':
+        function = getattr(scheduler, algorithm.lower())
+        args = {'RR': (quantum,), 'MLFQ': (quantums, allotments)}.get(algorithm, ())
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return function([dict(p) for p in processes], *args)[0]
+        return run
+
+    function = getattr(cli, algorithm.lower())
+    answers = {'RR': [str(quantum)], 'MLFQ': ['4', str(quantum), str(allotments[0])]}.get(algorithm, [])
+
+    def run():
+        with scripted_input(answers):
+            return function([dict(p) for p in processes])[0]
+    return run
+
+
+def skip_reason(target, algorithm, table, quantum):
+    if algorithm in ('RR', 'MLFQ'):
+        slices = sum(table.burst) // quantum + len(table)
+        if slices > SLICE_LIMIT:
+            return f"~{slices:.1e} slices > {SLICE_LIMIT:.1e}"
+    if target not in SLOW_TARGETS:
+        return None
+    n = len(table)
+    if algorithm in ('FIFO', 'SJF'):
+        work = n * n
+    elif (target, algorithm) == ('cli', 'SRTF'):
+        work = n * max(1, n.bit_length())
+    else:
+        work = n * (max(table.arrival) + sum(table.burst))
+    if work > WORK_LIMITS[algorithm]:
+        return f"~{work:.1e} steps > {WORK_LIMITS[algorithm]:.1e}"
+    return None
+
+
+def measure(run, repeat):
+    best = None
+    events = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        events = len(result) if result is not None else 0
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': best, 'peakBytes': peak, 'events': events}
+
+
+def run_suite(sizes, shapes, algorithms, targets, repeat=3, seed=0):
+    cli = load_cli() if 'cli' in targets else None
+    results = []
+    for shape in shapes:
+        params = shape_params(shape)
+        for n in sizes:
+            table = make_workload(shape, n, seed)
+            for algorithm in algorithms:
+                for target in targets:
+                    row = {'target': target, 'algorithm': algorithm, 'shape': shape, 'n': n}
+                    reason = skip_reason(target, algorithm, table, params['quantum'])
+                    if reason:
+                        row['skipped'] = reason
+                    else:
+                        row.update(measure(make_case(target, algorithm, table, params, cli), repeat))
+                    results.append(row)
+                    print_row(row)
+    return results
+
+
+def print_row(row):
+    label = f"{row['target']:<9} {row['algorithm']:<5} {row['shape']:<12} n={row['n']:<8}"
+    if 'skipped' in row:
+        print(f"{label} skipped ({row['skipped']})", file=sys.stderr)
+    else:
+        print(f"{label} {row['seconds'] * 1000:>10.2f} ms {row['peakBytes'] / 1024:>10.0f} KiB "
+              f"{row['events']:>9} events", file=sys.stderr)
+
+
+def row_key(row):
+    return f"{row['target']}/{row['algorithm']}/{row['shape']}/{row['n']}"
+
+
+def compare(results, baseline, tolerance):
+    previous = {row_key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(row_key(row))
+        if old is None or 'skipped' in row or 'skipped' in old:
+            continue
+        for field in ('seconds', 'peakBytes'):
+            if old[field] and row[field] > old[field] * (1 + tolerance):
+                regressions.append({
+                    'case': row_key(row),
+                    'metric': field,
+                    'baseline': old[field],
+                    'current': row[field],
+                    'ratio': row[field] / old[field]
+                })
+    return regressions
+
+
+def parse_list(text, convert=str):
+    return [convert(v) for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling engines.")
+    parser.add_argument('--sizes', default='10,100,1000,10000,100000,1000000')
+    parser.add_argument('--shapes', default=','.join(SHAPES))
+    parser.add_argument('--algorithms', default=','.join(ALGORITHMS))
+    parser.add_argument('--targets', default=','.join(TARGETS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help="write results to this JSON file as a new baseline")
+    parser.add_argument('--baseline', help="compare against a saved baseline JSON file")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown/growth before a case counts as a regression")
+    args = parser.parse_args()
+
+    results = run_suite(parse_list(args.sizes, int), parse_list(args.shapes),
+                        parse_list(args.algorithms), parse_list(args.targets),
+                        args.repeat, args.seed)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        json.dump({'regressions': regressions}, sys.stdout, indent=2)
+        print()
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+
+
+class ResultCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def info(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRatio': self.hits / lookups if lookups else 0.0,
+                'size': len(self.entries),
+                'maxsize': self.maxsize
+            }
+
+
+def result_key(table, algorithm, args, metricsOnly=False):
+    h = hashlib.sha256(table.digest().encode())
+    h.update(repr((algorithm, args, metricsOnly)).encode())
+    return h.hexdigest()
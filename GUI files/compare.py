@@ -0,0 +1,43 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import engines
+import metrics
+
+# below this many processes the pool's pickling overhead outweighs the work
+PARALLEL_THRESHOLD = 2000
+
+executor = None
+
+
+def get_executor():
+    global executor
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=min(len(engines.ALGORITHMS), os.cpu_count() or 1))
+    return executor
+
+
+def run_one(algorithm, table, args, metricsOnly):
+    if metricsOnly:
+        stats, averageMetrics = metrics.ALGORITHMS[algorithm](table, *args)
+        return {'events': [], 'stats': stats, 'averageMetrics': averageMetrics}
+    events, stats, averageMetrics = engines.ALGORITHMS[algorithm](table, *args)
+    return {'events': events.to_list(), 'stats': stats, 'averageMetrics': averageMetrics}
+
+
+def compare(table, jobs, metricsOnly=False):
+    # sorted once here; the cached order travels with the table to every worker
+    table.arrival_order()
+
+    if len(table) < PARALLEL_THRESHOLD or len(jobs) < 2:
+        results = {algorithm: run_one(algorithm, table, args, metricsOnly)
+                   for algorithm, args in jobs.items()}
+    else:
+        pool = get_executor()
+        futures = {algorithm: pool.submit(run_one, algorithm, table, args, metricsOnly)
+                   for algorithm, args in jobs.items()}
+        results = {algorithm: future.result() for algorithm, future in futures.items()}
+
+    comparison = [dict(algorithm=algorithm, **result['averageMetrics'])
+                  for algorithm, result in results.items()]
+    return results, comparison
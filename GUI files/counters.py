@@ -0,0 +1,141 @@
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+
+FIELDS = ('dispatches', 'contextSwitches', 'queueOps', 'idleJumps', 'heapPushes', 'heapPops')
+
+HELP = {
+    'dispatches': "Scheduling decisions that handed the CPU to a process.",
+    'contextSwitches': "Dispatches of a different process than the one that ran last.",
+    'queueOps': "Ready-queue appends and pops (RR/MLFQ run queues).",
+    'idleJumps': "Idle gaps skipped by jumping the clock to the next arrival.",
+    'heapPushes': "Ready-heap pushes (SJF/SRTF).",
+    'heapPops': "Ready-heap pops (SJF/SRTF)."
+}
+
+PROMETHEUS_NAMES = {
+    'dispatches': 'scheduler_dispatches_total',
+    'contextSwitches': 'scheduler_context_switches_total',
+    'queueOps': 'scheduler_queue_ops_total',
+    'idleJumps': 'scheduler_idle_jumps_total',
+    'heapPushes': 'scheduler_heap_pushes_total',
+    'heapPops': 'scheduler_heap_pops_total'
+}
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EngineCounters:
+    # engines read `enabled` once per run and only flush their local tallies
+    # here when it is set, so a disabled registry costs one flag check per run
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        self.totals = {}
+        self.runs = {}
+        self.phases = {}
+
+    def record(self, engine, algorithm, **counts):
+        key = (engine, algorithm)
+        with self.lock:
+            totals = self.totals.setdefault(key, dict.fromkeys(FIELDS, 0))
+            for field, value in counts.items():
+                totals[field] += value
+            self.runs[key] = self.runs.get(key, 0) + 1
+
+    @contextmanager
+    def phase(self, algorithm, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.phases[(algorithm, name)] = self.phases.get((algorithm, name), 0.0) + elapsed
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.totals), dict(self.runs), dict(self.phases)
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.lock = Lock()
+        self.series = {}
+
+    def observe(self, labels, value):
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self.series.items()}
+
+
+def format_labels(labels):
+    return '{' + ','.join(f'{name}="{value}"' for name, value in labels) + '}' if labels else ''
+
+
+def exposition(counters, latency, cacheInfo):
+    totals, runs, phases = counters.snapshot()
+    lines = []
+
+    def header(name, kind, text):
+        lines.append(f"# HELP {name} {text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    header('scheduler_counters_enabled', 'gauge', "1 when engine hot-path counters are being collected.")
+    lines.append(f"scheduler_counters_enabled {int(counters.enabled)}")
+
+    header('scheduler_runs_total', 'counter', "Engine runs that reported counters.")
+    for (engine, algorithm), value in sorted(runs.items()):
+        lines.append(f"scheduler_runs_total{format_labels((('engine', engine), ('algorithm', algorithm)))} {value}")
+
+    for field in FIELDS:
+        name = PROMETHEUS_NAMES[field]
+        header(name, 'counter', HELP[field])
+        for (engine, algorithm), values in sorted(totals.items()):
+            lines.append(f"{name}{format_labels((('engine', engine), ('algorithm', algorithm)))} {values[field]}")
+
+    header('scheduler_phase_seconds_total', 'counter', "Wall time spent per request phase.")
+    for (algorithm, phase), seconds in sorted(phases.items()):
+        lines.append(f"scheduler_phase_seconds_total{format_labels((('algorithm', algorithm), ('phase', phase)))} {seconds:.6f}")
+
+    name = 'http_request_duration_seconds'
+    header(name, 'histogram', "Request latency by handler.")
+    for labels, (counts, total, count) in sorted(latency.snapshot().items()):
+        cumulative = 0
+        for bound, bucketCount in zip(latency.buckets, counts):
+            cumulative += bucketCount
+            lines.append(f"{name}_bucket{format_labels(labels + (('le', repr(bound)),))} {cumulative}")
+        lines.append(f"{name}_bucket{format_labels(labels + (('le', '+Inf'),))} {count}")
+        lines.append(f"{name}_sum{format_labels(labels)} {total:.6f}")
+        lines.append(f"{name}_count{format_labels(labels)} {count}")
+
+    header('scheduler_cache_hits_total', 'counter', "Result cache hits.")
+    lines.append(f"scheduler_cache_hits_total {cacheInfo['hits']}")
+    header('scheduler_cache_misses_total', 'counter', "Result cache misses.")
+    lines.append(f"scheduler_cache_misses_total {cacheInfo['misses']}")
+    header('scheduler_cache_hit_ratio', 'gauge', "Result cache hits over lookups.")
+    lines.append(f"scheduler_cache_hit_ratio {cacheInfo['hitRatio']}")
+    header('scheduler_cache_entries', 'gauge', "Results currently cached.")
+    lines.append(f"scheduler_cache_entries {cacheInfo['size']}")
+
+    return '\n'.join(lines) + '\n'
+
+
+COUNTERS = EngineCounters(os.environ.get('SCHEDULER_COUNTERS', '').lower() in ('1', 'true', 'yes'))
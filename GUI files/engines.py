@@ -0,0 +1,480 @@
+import heapq
+from collections import deque
+
+from counters import COUNTERS
+from eventlog import EventLog, IDLE, NO_LEVEL
+from tracing import TRACE
+from workload import ProcessTable
+
+SEGMENT = 0
+COMPLETE = 1
+
+
+def averages(statList):
+    totalTAT = sum(p['turnaround'] for p in statList)
+    totalRT = sum(p['response'] for p in statList)
+    totalWT = sum(p['waiting'] for p in statList)
+    return {
+        'averageTurnaroundTime': totalTAT / len(statList),
+        'averageResponseTime': totalRT / len(statList),
+        'averageWaitingTime': totalWT / len(statList)
+    }
+
+
+def collect(records, withQueueLevel=False, key=None):
+    events = EventLog(withQueueLevel)
+    completed = []
+    for record in records:
+        if record[0] == SEGMENT:
+            _, pid, start, end, queueLevel = record
+            events.append(pid, start, end, queueLevel)
+        else:
+            completed.append((record[1], record[2]))
+
+    if key is not None:
+        completed.sort(key=key)
+    statList = [stat for _, stat in completed]
+    return events, statList, averages(statList)
+
+
+def iter_fifo(processes):
+    table = ProcessTable.coerce(processes)
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    n = len(table)
+    current = 0
+    idleJumps = 0
+    tracing = TRACE.debug
+
+    for i in sorted(range(n), key=lambda i: (arrivals[i], pids[i])):
+        pid, arrival, burst = pids[i], arrivals[i], bursts[i]
+        if current < arrival:
+            yield SEGMENT, IDLE, current, arrival, NO_LEVEL
+            current = arrival
+            idleJumps += 1
+
+        startTime = current
+        completeTime = startTime + burst
+        if tracing:
+            TRACE.emit('debug', 'dispatch', algorithm='FIFO', time=startTime, pid=pid, run=burst)
+        turnaroundTime = completeTime - arrival
+        responseTime = startTime - arrival
+        waitingTime = turnaroundTime - burst
+
+        yield SEGMENT, pid, startTime, completeTime, NO_LEVEL
+        yield COMPLETE, i, {
+            'pid': pid,
+            'arrival': arrival,
+            'burst': burst,
+            'executions': [{'start': startTime, 'duration': burst}],
+            'completeTime': completeTime,
+            'turnaround': turnaroundTime,
+            'response': responseTime,
+            'waiting': waitingTime
+        }
+        current = completeTime
+
+    if COUNTERS.enabled:
+        COUNTERS.record('engines', 'FIFO', dispatches=n, contextSwitches=max(n - 1, 0), idleJumps=idleJumps)
+
+
+def iter_srtf(processes):
+    table = ProcessTable.coerce(processes)
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    time = 0
+    stats_map = {}
+    ready = []
+    arrivalIndex = 0
+    current = None
+    last_switch = 0
+    counting = COUNTERS.enabled
+    tracing = TRACE.debug
+    decisions = segments = idleJumps = 0
+
+    while arrivalIndex < n or ready or current is not None:
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            i = order[arrivalIndex]
+            heapq.heappush(ready, (bursts[i], arrivals[i], pids[i], i))
+            arrivalIndex += 1
+
+        if current is None and not ready:
+            nextArrival = arrivals[order[arrivalIndex]]
+            yield SEGMENT, IDLE, time, nextArrival, NO_LEVEL
+            time = nextArrival
+            idleJumps += 1
+            continue
+
+        if counting:
+            decisions += 1
+
+        # the running job competes with new arrivals on (remaining, arrival, pid)
+        if current is not None:
+            heapq.heappush(ready, current)
+        entry = heapq.heappop(ready)
+        burstLeft, arrival, pid, i = entry
+
+        if current is None or current[2] != pid:
+            segments += 1
+            if tracing:
+                TRACE.emit('debug', 'dispatch', algorithm='SRTF', time=time, pid=pid, remaining=burstLeft,
+                           preempted=current[2] if current is not None else None)
+            if current is not None:
+                yield SEGMENT, current[2], last_switch, time, NO_LEVEL
+                stats_map[current[2]]['executions'].append({
+                    'start': last_switch,
+                    'duration': time - last_switch
+                })
+            last_switch = time
+
+            if pid not in stats_map:
+                stats_map[pid] = {
+                    'pid': pid,
+                    'arrival': arrival,
+                    'burst': bursts[i],
+                    'executions': [],
+                    'completeTime': None,
+                    'turnaround': None,
+                    'response': time - arrival,
+                    'waiting': None
+                }
+
+        if arrivalIndex < n and time + burstLeft > arrivals[order[arrivalIndex]]:
+            nextArrival = arrivals[order[arrivalIndex]]
+            current = (burstLeft - (nextArrival - time), arrival, pid, i)
+            time = nextArrival
+            continue
+
+        time += burstLeft
+        yield SEGMENT, pid, last_switch, time, NO_LEVEL
+        stat = stats_map.pop(pid)
+        stat['executions'].append({
+            'start': last_switch,
+            'duration': time - last_switch
+        })
+        stat['completeTime'] = time
+        stat['turnaround'] = time - arrival
+        stat['waiting'] = stat['turnaround'] - stat['burst']
+        yield COMPLETE, i, stat
+        current = None
+
+    if counting:
+        # every entry pushed (arrival or re-pushed runner) is popped exactly once
+        COUNTERS.record('engines', 'SRTF', dispatches=decisions, contextSwitches=max(segments - 1, 0),
+                        idleJumps=idleJumps, heapPushes=decisions, heapPops=decisions)
+
+
+def iter_rr(processes, quantum=1):
+    table = ProcessTable.coerce(processes)
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    n = len(table)
+    order = table.arrival_order()
+    time = 0
+    stats = {}
+    queue = deque()
+    remaining = bursts.tolist()
+    arrivalIndex = 0
+    finished = 0
+    counting = COUNTERS.enabled
+    tracing = TRACE.debug
+    dispatches = switches = idleJumps = 0
+    lastPid = None
+
+    def admit():
+        # arrivals inside one window are queued in submission order, like scheduler.rr()
+        nonlocal arrivalIndex
+        start = arrivalIndex
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            arrivalIndex += 1
+        if arrivalIndex - start > 1:
+            queue.extend(sorted(order[start:arrivalIndex]))
+        elif arrivalIndex > start:
+            queue.append(order[start])
+
+    admit()
+    while finished < n:
+        if not queue:
+            nextArrival = arrivals[order[arrivalIndex]]
+            yield SEGMENT, IDLE, time, nextArrival, NO_LEVEL
+            time = nextArrival
+            idleJumps += 1
+            admit()
+            continue
+
+        i = queue.popleft()
+        pid = pids[i]
+        arrival = arrivals[i]
+        burstLeft = remaining[i]
+        if counting:
+            dispatches += 1
+            if pid != lastPid:
+                switches += 1
+                lastPid = pid
+
+        if pid not in stats:
+            stats[pid] = {
+                'pid': pid,
+                'arrival': arrival,
+                'burst': bursts[i],
+                'startTime': time,
+                'executions': []
+            }
+
+        execTime = min(quantum, burstLeft)
+        if tracing:
+            TRACE.emit('debug', 'dispatch', algorithm='RR', time=time, pid=pid, run=execTime, queued=len(queue))
+        yield SEGMENT, pid, time, time + execTime, NO_LEVEL
+        stats[pid]['executions'].append({'start': time, 'duration': execTime})
+
+        time += execTime
+        remaining[i] -= execTime
+        admit()
+
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            stat = stats.pop(pid)
+            stat['completeTime'] = time
+            stat['turnaround'] = time - arrival
+            stat['response'] = stat['startTime'] - arrival
+            stat['waiting'] = stat['turnaround'] - stat['burst']
+            finished += 1
+            yield COMPLETE, i, stat
+
+    if counting:
+        # one popleft per slice, and one append per admission or requeue
+        COUNTERS.record('engines', 'RR', dispatches=dispatches, contextSwitches=max(switches - 1, 0),
+                        queueOps=2 * dispatches, idleJumps=idleJumps)
+
+
+def iter_mlfq(processes, quantums, allotments, boost=None):
+    table = ProcessTable.coerce(processes)
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    totalQueues = len(quantums)
+    order = table.arrival_order()
+    n = len(order)
+    time = 0
+    finished = 0
+    stats = {}
+    queues = [deque() for _ in range(totalQueues)]
+
+    remaining = bursts.tolist()
+    allotmentUsed = [0] * n
+    arrivalIndex = 0
+    nextBoost = boost if boost else None
+    counting = COUNTERS.enabled
+    tracing = TRACE.debug
+    dispatches = switches = idleJumps = boosted = 0
+    lastPid = None
+
+    while finished < n:
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            queues[0].append(order[arrivalIndex])
+            arrivalIndex += 1
+
+        if nextBoost is not None and time >= nextBoost:
+            for q in queues[1:]:
+                boosted += len(q)
+                queues[0].extend(q)
+                q.clear()
+            for i in queues[0]:
+                allotmentUsed[i] = 0
+            nextBoost = (time // boost + 1) * boost
+
+        queueLevel = next((level for level, q in enumerate(queues) if q), None)
+
+        if queueLevel is None:
+            nextArrival = arrivals[order[arrivalIndex]]
+            yield SEGMENT, IDLE, time, nextArrival, NO_LEVEL
+            time = nextArrival
+            idleJumps += 1
+            continue
+
+        i = queues[queueLevel].popleft()
+        pid = pids[i]
+        arrival = arrivals[i]
+        if counting:
+            dispatches += 1
+            if pid != lastPid:
+                switches += 1
+                lastPid = pid
+
+        if pid not in stats:
+            stats[pid] = {
+                'pid': pid,
+                'arrival': arrival,
+                'burst': bursts[i],
+                'startTime': time,
+                'executions': []
+            }
+
+        runTime = min(quantums[queueLevel], remaining[i])
+        if tracing:
+            TRACE.emit('debug', 'dispatch', algorithm='MLFQ', time=time, pid=pid, run=runTime, queueLevel=queueLevel)
+
+        yield SEGMENT, pid, time, time + runTime, queueLevel
+        stats[pid]['executions'].append({'start': time, 'duration': runTime})
+
+        time += runTime
+        remaining[i] -= runTime
+
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            queues[0].append(order[arrivalIndex])
+            arrivalIndex += 1
+
+        if remaining[i] > 0:
+            allotmentUsed[i] += runTime
+            if allotmentUsed[i] >= allotments[queueLevel] and queueLevel < totalQueues - 1:
+                queues[queueLevel + 1].append(i)
+                allotmentUsed[i] = 0
+            else:
+                queues[queueLevel].append(i)
+        else:
+            stat = stats.pop(pid)
+            stat['completeTime'] = time
+            stat['turnaround'] = time - arrival
+            stat['response'] = stat['startTime'] - arrival
+            stat['waiting'] = stat['turnaround'] - stat['burst']
+            finished += 1
+            yield COMPLETE, i, stat
+
+    if counting:
+        COUNTERS.record('engines', 'MLFQ', dispatches=dispatches, contextSwitches=max(switches - 1, 0),
+                        queueOps=2 * dispatches + boosted, idleJumps=idleJumps)
+
+
+def iter_sjf(processes):
+    table = ProcessTable.coerce(processes)
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    time = 0
+    ready = []
+    arrivalIndex = 0
+    idleJumps = 0
+    tracing = TRACE.debug
+
+    while arrivalIndex < n or ready:
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            i = order[arrivalIndex]
+            heapq.heappush(ready, (bursts[i], arrivals[i], pids[i], i))
+            arrivalIndex += 1
+
+        if not ready:
+            nextArrival = arrivals[order[arrivalIndex]]
+            yield SEGMENT, IDLE, time, nextArrival, NO_LEVEL
+            time = nextArrival
+            idleJumps += 1
+            continue
+
+        burst, arrival, pid, i = heapq.heappop(ready)
+        start = time
+        end = start + burst
+        time = end
+        if tracing:
+            TRACE.emit('debug', 'dispatch', algorithm='SJF', time=start, pid=pid, run=burst, ready=len(ready))
+
+        turnaround = end - arrival
+        response = start - arrival
+        waiting = turnaround - burst
+
+        yield SEGMENT, pid, start, end, NO_LEVEL
+        yield COMPLETE, i, {
+            'pid': pid,
+            'arrival': arrival,
+            'burst': burst,
+            'executions': [{'start': start, 'duration': burst}],
+            'completeTime': end,
+            'turnaround': turnaround,
+            'response': response,
+            'waiting': waiting
+        }
+
+    if COUNTERS.enabled:
+        COUNTERS.record('engines', 'SJF', dispatches=n, contextSwitches=max(n - 1, 0),
+                        idleJumps=idleJumps, heapPushes=n, heapPops=n)
+
+
+def fifo(processes):
+    return collect(iter_fifo(processes))
+
+
+def sjf(processes):
+    return collect(iter_sjf(processes))
+
+
+def srtf(processes):
+    # scheduler.srtf() lists processes in the order they first got the CPU
+    return collect(iter_srtf(processes), key=lambda r: r[1]['arrival'] + r[1]['response'])
+
+
+def rr(processes, quantum=1):
+    return collect(iter_rr(processes, quantum), key=lambda r: r[0])
+
+
+def mlfq(processes, quantums, allotments, boost=None):
+    return collect(iter_mlfq(processes, quantums, allotments, boost), True,
+                   key=lambda r: (r[1]['arrival'], r[0]))
+
+
+ALGORITHMS = {
+    'FIFO': fifo,
+    'SJF': sjf,
+    'SRTF': srtf,
+    'RR': rr,
+    'MLFQ': mlfq
+}
+
+
+STREAMS = {
+    'FIFO': iter_fifo,
+    'SJF': iter_sjf,
+    'SRTF': iter_srtf,
+    'RR': iter_rr,
+    'MLFQ': iter_mlfq
+}
+
+
+def stream(algorithm, processes, *args):
+    withQueueLevel = algorithm == 'MLFQ'
+    count = totalTAT = totalRT = totalWT = 0
+    pending = None
+
+    def segment(pid, start, end, queueLevel):
+        event = {'type': 'segment', 'pid': 'idle' if pid == IDLE else pid, 'start': start, 'end': end}
+        if withQueueLevel:
+            event['queueLevel'] = None if queueLevel == NO_LEVEL else queueLevel
+        return event
+
+    for record in STREAMS[algorithm](processes, *args):
+        if record[0] == SEGMENT:
+            _, pid, start, end, queueLevel = record
+            # hold one segment back so back-to-back runs coalesce like EventLog
+            if pending and pending[0] == pid and pending[2] == start and pending[3] == queueLevel:
+                pending[2] = end
+                continue
+            if pending:
+                yield segment(*pending)
+            pending = [pid, start, end, queueLevel]
+            continue
+
+        if pending:
+            yield segment(*pending)
+            pending = None
+        stat = record[2]
+        count += 1
+        totalTAT += stat['turnaround']
+        totalRT += stat['response']
+        totalWT += stat['waiting']
+        yield {
+            'type': 'complete',
+            'stats': stat,
+            'averageMetrics': {
+                'averageTurnaroundTime': totalTAT / count,
+                'averageResponseTime': totalRT / count,
+                'averageWaitingTime': totalWT / count
+            }
+        }
+
+    if pending:
+        yield segment(*pending)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+import argparse
+import copy
+import contextlib
+import io
+import json
+import random
+import sys
+
+import engines
+import metrics
+import scheduler
+
+REFERENCE = {
+    'FIFO': scheduler.fifo,
+    'SJF': scheduler.sjf,
+    'SRTF': scheduler.srtf,
+    'RR': scheduler.rr,
+    'MLFQ': scheduler.mlfq
+}
+
+# fast engines checked against scheduler.py; events=False marks engines that
+# only produce (stats, averageMetrics) without executions or a timeline, and
+# ordered=False ones list stats in their own order, so stats are matched by pid
+ENGINES = {}
+
+STAT_FIELDS = ('pid', 'arrival', 'burst', 'completeTime', 'turnaround', 'response', 'waiting')
+
+
+def register(name, algorithms, events=True, ordered=True):
+    ENGINES[name] = {'algorithms': algorithms, 'events': events, 'ordered': ordered}
+
+
+register('engines', engines.ALGORITHMS)
+register('metrics', metrics.ALGORITHMS, events=False, ordered=False)
+
+
+def random_workload(rng):
+    n = rng.randint(1, 10)
+    return [(rng.randint(0, 15), rng.randint(1, 8)) for _ in range(n)]
+
+
+def simultaneous(rng):
+    arrival = rng.randint(0, 3)
+    return [(arrival, rng.randint(1, 3)) for _ in range(rng.randint(2, 10))]
+
+
+def identical(rng):
+    arrival, burst = rng.randint(0, 5), rng.randint(1, 6)
+    return [(arrival, burst)] * rng.randint(2, 8)
+
+
+def idle_gaps(rng):
+    workload, t = [], rng.randint(0, 10)
+    for _ in range(rng.randint(1, 8)):
+        workload.append((t, rng.randint(1, 4)))
+        t += rng.randint(0, 12)
+    return workload
+
+
+def reversed_arrivals(rng):
+    workload = random_workload(rng)
+    return sorted(workload, reverse=True)
+
+
+def boundary_arrivals(rng):
+    # arrivals land exactly on completion and quantum boundaries
+    step = rng.randint(1, 4)
+    return [(step * k, rng.choice((1, 2, 4, 8))) for k in range(rng.randint(2, 10))]
+
+
+SHAPES = {
+    'random': random_workload,
+    'simultaneous': simultaneous,
+    'identical': identical,
+    'idle-gaps': idle_gaps,
+    'reversed': reversed_arrivals,
+    'boundaries': boundary_arrivals
+}
+
+
+def make_processes(rng, shape, shufflePids=False):
+    workload = SHAPES[shape](rng)
+    pids = list(range(1, len(workload) + 1))
+    if shufflePids:
+        rng.shuffle(pids)
+    return [{'pid': pid, 'arrival': arrival, 'burst': burst} for pid, (arrival, burst) in zip(pids, workload)]
+
+
+def make_args(rng, algorithm):
+    if algorithm == 'RR':
+        return (rng.randint(1, 5),)
+    if algorithm == 'MLFQ':
+        levels = rng.randint(1, 5)
+        return ([rng.randint(1, 6) for _ in range(levels)], [rng.randint(1, 10) for _ in range(levels)])
+    return ()
+
+
+def coalesce(events):
+    merged = []
+    for event in events:
+        event = dict(event)
+        last = merged[-1] if merged else None
+        if (last and last['pid'] == event['pid'] and last['end'] == event['start']
+                and last.get('queueLevel') == event.get('queueLevel')):
+            last['end'] = event['end']
+        else:
+            merged.append(event)
+    return merged
+
+
+def run_reference(algorithm, processes, args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return REFERENCE[algorithm](copy.deepcopy(processes), *copy.deepcopy(args))
+
+
+def check(engine, algorithm, processes, args):
+    expectedEvents, expectedStats, expectedAverages = run_reference(algorithm, processes, args)
+    spec = ENGINES[engine]
+    result = spec['algorithms'][algorithm](copy.deepcopy(processes), *copy.deepcopy(args))
+
+    if spec['events']:
+        events, stats, averageMetrics = result
+        expectedEvents, events = coalesce(expectedEvents), list(events)
+        if expectedEvents != events:
+            index = next((k for k, (a, b) in enumerate(zip(expectedEvents, events)) if a != b),
+                         min(len(expectedEvents), len(events)))
+            return {
+                'field': 'events',
+                'index': index,
+                'expected': expectedEvents[index] if index < len(expectedEvents) else None,
+                'actual': events[index] if index < len(events) else None
+            }
+    else:
+        stats, averageMetrics = result
+        expectedStats = [{k: s[k] for k in STAT_FIELDS} for s in expectedStats]
+        stats = [{k: s[k] for k in STAT_FIELDS} for s in stats]
+
+    if not spec['ordered']:
+        expectedStats = sorted(expectedStats, key=lambda s: s['pid'])
+        stats = sorted(stats, key=lambda s: s['pid'])
+
+    if expectedStats != stats:
+        index = next((k for k, (a, b) in enumerate(zip(expectedStats, stats)) if a != b),
+                     min(len(expectedStats), len(stats)))
+        return {
+            'field': 'stats',
+            'index': index,
+            'expected': expectedStats[index] if index < len(expectedStats) else None,
+            'actual': stats[index] if index < len(stats) else None
+        }
+
+    if expectedAverages != averageMetrics:
+        return {'field': 'averageMetrics', 'expected': expectedAverages, 'actual': averageMetrics}
+    return None
+
+
+def smaller_values(value, floor):
+    return [v for v in dict.fromkeys((floor, value // 2, value - 1)) if floor <= v < value]
+
+
+def smaller_args(algorithm, args):
+    if algorithm == 'RR':
+        return [(q,) for q in smaller_values(args[0], 1)]
+    if algorithm == 'MLFQ':
+        quantums, allotments = args
+        candidates = []
+        if len(quantums) > 1:
+            candidates.append((quantums[:-1], allotments[:-1]))
+        for level in range(len(quantums)):
+            for q in smaller_values(quantums[level], 1):
+                candidates.append((quantums[:level] + [q] + quantums[level + 1:], allotments))
+            for a in smaller_values(allotments[level], 1):
+                candidates.append((quantums, allotments[:level] + [a] + allotments[level + 1:]))
+        return candidates
+    return []
+
+
+def shrink(engine, algorithm, processes, args):
+    # greedy: keep applying the first simplification that still fails until none does
+    def fails(candidateProcesses, candidateArgs):
+        try:
+            return check(engine, algorithm, candidateProcesses, candidateArgs) is not None
+        except Exception:
+            return True
+
+    changed = True
+    while changed:
+        changed = False
+        candidates = [processes[:i] + processes[i + 1:] for i in range(len(processes))] if len(processes) > 1 else []
+        for i, p in enumerate(processes):
+            for field, floor in (('arrival', 0), ('burst', 1)):
+                for value in smaller_values(p[field], floor):
+                    candidates.append(processes[:i] + [dict(p, **{field: value})] + processes[i + 1:])
+        renumbered = [dict(p, pid=k + 1) for k, p in enumerate(processes)]
+        if renumbered != processes:
+            candidates.append(renumbered)
+
+        for candidate in candidates:
+            if fails(candidate, args):
+                processes, changed = candidate, True
+                break
+        else:
+            for candidate in smaller_args(algorithm, args):
+                if fails(processes, candidate):
+                    args, changed = candidate, True
+                    break
+
+    return processes, args
+
+
+def run(engine, algorithms, shapes, trials, seed=0):
+    rng = random.Random(seed)
+    failures = []
+    for algorithm in algorithms:
+        for shape in shapes:
+            for trial in range(trials):
+                processes = make_processes(rng, shape, shufflePids=trial % 2 == 1)
+                args = make_args(rng, algorithm)
+                try:
+                    difference = check(engine, algorithm, processes, args)
+                except Exception as e:
+                    difference = {'field': 'exception', 'error': repr(e)}
+                if difference is None:
+                    continue
+                processes, args = shrink(engine, algorithm, processes, args)
+                try:
+                    difference = check(engine, algorithm, processes, args)
+                except Exception as e:
+                    difference = {'field': 'exception', 'error': repr(e)}
+                failures.append({
+                    'engine': engine,
+                    'algorithm': algorithm,
+                    'shape': shape,
+                    'processes': processes,
+                    'args': list(args),
+                    'difference': difference
+                })
+                break
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check fast engines against scheduler.py.")
+    parser.add_argument('--engines', default=','.join(ENGINES))
+    parser.add_argument('--algorithms', default=','.join(REFERENCE))
+    parser.add_argument('--shapes', default=','.join(SHAPES))
+    parser.add_argument('--trials', type=int, default=500, help="workloads per algorithm and shape")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    algorithms = args.algorithms.split(',')
+    shapes = args.shapes.split(',')
+    failures = []
+    for engine in args.engines.split(','):
+        found = run(engine, algorithms, shapes, args.trials, args.seed)
+        print(f"{engine}: {len(algorithms) * len(shapes)} suites, {len(found)} failing", file=sys.stderr)
+        failures += found
+
+    if failures:
+        json.dump(failures, sys.stdout, indent=2)
+        print()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+from array import array
+
+IDLE = -1
+NO_LEVEL = -1
+
+
+class EventLog:
+    __slots__ = ('start', 'end', 'pid', 'queueLevel', 'withQueueLevel')
+
+    def __init__(self, withQueueLevel=False):
+        self.start = array('q')
+        self.end = array('q')
+        self.pid = array('q')
+        self.queueLevel = array('i')
+        self.withQueueLevel = withQueueLevel
+
+    def append(self, pid, start, end, queueLevel=NO_LEVEL):
+        # back-to-back segments of the same pid (and level) extend the previous one
+        if (self.pid and self.pid[-1] == pid and self.end[-1] == start
+                and self.queueLevel[-1] == queueLevel):
+            self.end[-1] = end
+            return
+        self.start.append(start)
+        self.end.append(end)
+        self.pid.append(pid)
+        self.queueLevel.append(queueLevel)
+
+    def __len__(self):
+        return len(self.start)
+
+    def __iter__(self):
+        for start, end, pid, queueLevel in zip(self.start, self.end, self.pid, self.queueLevel):
+            event = {'pid': 'idle' if pid == IDLE else pid, 'start': start, 'end': end}
+            if self.withQueueLevel:
+                event['queueLevel'] = None if queueLevel == NO_LEVEL else queueLevel
+            yield event
+
+    def __repr__(self):
+        return f"EventLog({len(self)} segments)"
+
+    def to_list(self):
+        return list(self)
+
+    def copy(self):
+        log = EventLog(self.withQueueLevel)
+        for name in ('start', 'end', 'pid', 'queueLevel'):
+            getattr(log, name).extend(getattr(self, name))
+        return log
+
+    def truncate(self, length):
+        del self.start[length:]
+        del self.end[length:]
+        del self.pid[length:]
+        del self.queueLevel[length:]
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sys
+from array import array
+
+from tracefile import write_workload
+from workload import ProcessTable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ARRIVALS = ('poisson', 'mmpp')
+BURSTS = ('exponential', 'lognormal', 'pareto')
+DEFAULT_UTILIZATION = 0.8
+
+
+def requireNumpy():
+    if np is None:
+        raise ImportError("generator requires numpy (pip install numpy)")
+
+
+def draw_bursts(rng, n, kind, mean, sigma, alpha):
+    # continuous draws with the requested mean, rounded up to whole ticks
+    if kind == 'exponential':
+        values = rng.exponential(mean, n)
+    elif kind == 'lognormal':
+        values = rng.lognormal(np.log(mean) - sigma * sigma / 2, sigma, n)
+    elif kind == 'pareto':
+        if alpha <= 1:
+            raise ValueError("pareto alpha must be greater than 1 for a finite mean")
+        values = mean * (alpha - 1) / alpha * (1 + rng.pareto(alpha, n))
+    else:
+        raise ValueError(f"unknown burst distribution {kind}")
+    return np.maximum(np.ceil(values), 1).astype(np.int64)
+
+
+def draw_gaps(rng, n, kind, rate, burstiness, dwell):
+    if kind == 'poisson':
+        return rng.exponential(1 / rate, n)
+    if kind != 'mmpp':
+        raise ValueError(f"unknown arrival process {kind}")
+    if burstiness < 1 or dwell < 1:
+        raise ValueError("mmpp burstiness and dwell must be at least 1")
+    # two-state MMPP: sojourns last a geometric number of arrivals (mean `dwell`)
+    # and alternate between a low and a `burstiness` times faster high state,
+    # with rates chosen so the long-run mean gap is still 1 / rate
+    low = rate * (1 + 1 / burstiness) / 2
+    high = low * burstiness
+    lengths = rng.geometric(1 / dwell, 2 * (n // dwell) + 16)
+    while lengths.sum() < n:
+        lengths = np.concatenate((lengths, rng.geometric(1 / dwell, len(lengths))))
+    states = np.arange(len(lengths)) % 2 == rng.integers(2)
+    means = np.repeat(np.where(states, 1 / high, 1 / low), lengths)[:n]
+    return rng.exponential(1.0, n) * means
+
+
+def to_array(values):
+    column = array('q')
+    column.frombytes(np.ascontiguousarray(values, dtype='<i8' if sys.byteorder == 'little' else '>i8').tobytes())
+    return column
+
+
+def generate(n, arrival='poisson', burst='exponential', meanBurst=10, utilization=None, rate=None,
+             seed=None, sigma=1.0, alpha=2.5, burstiness=10, dwell=100):
+    # rate is arrivals per tick; without one it is derived from the target
+    # utilization of a single CPU, rate = utilization / mean burst
+    requireNumpy()
+    if n < 0:
+        raise ValueError("n must not be negative")
+    if meanBurst <= 0:
+        raise ValueError("meanBurst must be positive")
+    if rate is not None and utilization is not None:
+        raise ValueError("give a rate or a utilization, not both")
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    rng = np.random.default_rng(seed)
+
+    bursts = draw_bursts(rng, n, burst, meanBurst, sigma, alpha)
+    if rate is None:
+        utilization = DEFAULT_UTILIZATION if utilization is None else utilization
+        if utilization <= 0:
+            raise ValueError("utilization must be positive")
+        # use the drawn (rounded) mean so the offered load hits the target
+        rate = utilization / bursts.mean() if n else 1.0
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+
+    gaps = draw_gaps(rng, n, arrival, rate, burstiness, dwell)
+    if n:
+        gaps[0] = 0
+    arrivals = np.floor(np.cumsum(gaps)).astype(np.int64)
+
+    table = ProcessTable.from_columns(array('q', range(1, n + 1)), to_array(arrivals), to_array(bursts))
+    span = int(arrivals[-1]) if n else 0
+    info = {
+        'seed': seed,
+        'processes': n,
+        'arrival': arrival,
+        'burst': burst,
+        'rate': rate,
+        'meanBurst': float(bursts.mean()) if n else 0.0,
+        'span': span,
+        'offeredUtilization': float(bursts.sum()) / span if span else None
+    }
+    return table, info
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic workload.")
+    parser.add_argument('n', type=int, help="number of processes")
+    parser.add_argument('output', help="binary workload file to write, or .json")
+    parser.add_argument('--arrival', choices=ARRIVALS, default='poisson')
+    parser.add_argument('--burst', choices=BURSTS, default='exponential')
+    parser.add_argument('--mean-burst', type=float, default=10)
+    parser.add_argument('--utilization', type=float, help=f"target CPU utilization (default {DEFAULT_UTILIZATION})")
+    parser.add_argument('--rate', type=float, help="arrivals per tick, instead of --utilization")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--sigma', type=float, default=1.0, help="lognormal shape")
+    parser.add_argument('--alpha', type=float, default=2.5, help="pareto tail index")
+    parser.add_argument('--burstiness', type=float, default=10, help="mmpp high/low rate ratio")
+    parser.add_argument('--dwell', type=int, default=100, help="mmpp mean arrivals per state")
+    args = parser.parse_args()
+
+    table, info = generate(args.n, args.arrival, args.burst, args.mean_burst, args.utilization, args.rate,
+                           args.seed, args.sigma, args.alpha, args.burstiness, args.dwell)
+    if args.output.lower().endswith('.json'):
+        with open(args.output, 'w') as f:
+            json.dump(table.to_dicts(), f)
+    else:
+        write_workload(args.output, table)
+    json.dump(info, sys.stderr, indent=2)
+    print(file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import hashlib
+import heapq
+from array import array
+from threading import Lock
+
+from counters import COUNTERS
+from engines import averages
+from eventlog import EventLog, IDLE
+from tracing import TRACE
+
+# FIFO is non-preemptive priority scheduling on (arrival, pid), SJF on (burst, arrival, pid)
+PRIORITIES = {
+    'FIFO': lambda pid, arrival, burst: (arrival, pid),
+    'SJF': lambda pid, arrival, burst: (burst, arrival, pid)
+}
+
+
+class IncrementalRun:
+    def __init__(self, algorithm, interval=64):
+        self.algorithm = algorithm
+        self.priority = PRIORITIES[algorithm]
+        self.interval = interval
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        self.seen = 0
+        self.prefix = None
+        self.events = EventLog()
+        self.stats = []
+        # job index of each dispatch, in order; with it a checkpoint can rebuild
+        # its ready heap instead of storing a copy
+        self.dispatched = array('q')
+        self.checkpoints = []
+        self.final = None
+
+    def prefix_digest(self, table, length):
+        h = hashlib.blake2b(digest_size=16)
+        for column in (table.pid, table.arrival, table.burst):
+            h.update(memoryview(column)[:length])
+        return h.digest()
+
+    def run(self, table):
+        with self.lock:
+            n = len(table)
+            if n < self.seen or self.prefix != self.prefix_digest(table, self.seen):
+                self.reset()
+
+            if self.final is None or n > self.seen:
+                earliest = min(table.arrival[self.seen:n]) if n > self.seen else None
+                self.resume(table, earliest)
+                self.seen = n
+                self.prefix = self.prefix_digest(table, n)
+
+            # callers serialize after the lock is released, so they get a private log
+            return self.events.copy(), list(self.stats), averages(self.stats)
+
+    def resume(self, table, earliest):
+        # a checkpoint is still exact if every appended job arrives after it
+        while self.checkpoints and earliest is not None and self.checkpoints[-1][0] >= earliest:
+            self.checkpoints.pop()
+        pids, arrivals, bursts = table.pid, table.arrival, table.burst
+        order = table.arrival_order()
+        n = len(order)
+        priority = self.priority
+
+        if self.checkpoints:
+            time, arrivalIndex, nStats, nEvents = self.checkpoints[-1]
+        else:
+            time, arrivalIndex, nStats, nEvents = 0, 0, 0, 0
+        del self.stats[nStats:]
+        del self.dispatched[nStats:]
+        self.events.truncate(nEvents)
+        # the ready heap at the checkpoint: everything admitted but not yet dispatched
+        done = set(self.dispatched)
+        ready = [(priority(pids[i], arrivals[i], bursts[i]), i) for i in order[:arrivalIndex] if i not in done]
+        heapq.heapify(ready)
+        del done
+
+        stats, events, checkpoints, dispatched = self.stats, self.events, self.checkpoints, self.dispatched
+        steps = 0
+        firstArrival = arrivalIndex
+        idleJumps = 0
+        tracing = TRACE.debug
+        if tracing:
+            TRACE.emit('debug', 'resume', algorithm=self.algorithm, time=time, fromIndex=arrivalIndex, n=n)
+
+        while arrivalIndex < n or ready:
+            if steps % self.interval == 0:
+                checkpoints.append((time, arrivalIndex, len(stats), len(events)))
+            steps += 1
+
+            while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+                i = order[arrivalIndex]
+                heapq.heappush(ready, (priority(pids[i], arrivals[i], bursts[i]), i))
+                arrivalIndex += 1
+
+            if not ready:
+                nextArrival = arrivals[order[arrivalIndex]]
+                events.append(IDLE, time, nextArrival)
+                time = nextArrival
+                idleJumps += 1
+                continue
+
+            _, i = heapq.heappop(ready)
+            pid, arrival, burst = pids[i], arrivals[i], bursts[i]
+            start = time
+            end = start + burst
+            time = end
+            if tracing:
+                TRACE.emit('debug', 'dispatch', algorithm=self.algorithm, time=start, pid=pid, run=burst)
+
+            stats.append({
+                'pid': pid,
+                'arrival': arrival,
+                'burst': burst,
+                'executions': [{'start': start, 'duration': burst}],
+                'completeTime': end,
+                'turnaround': end - arrival,
+                'response': start - arrival,
+                'waiting': end - arrival - burst
+            })
+            events.append(pid, start, end)
+            dispatched.append(i)
+
+        self.final = time
+
+        if COUNTERS.enabled:
+            dispatched = len(stats) - nStats
+            COUNTERS.record('incremental', self.algorithm, dispatches=dispatched,
+                            contextSwitches=dispatched if nStats else max(dispatched - 1, 0),
+                            idleJumps=idleJumps, heapPushes=arrivalIndex - firstArrival, heapPops=dispatched)
@@ -0,0 +1,181 @@
+import csv
+import io
+import json
+import re
+from array import array
+
+from workload import INT64_MAX
+
+CHUNK = 64 * 1024
+# a single JSON record larger than this is treated as malformed rather than buffered
+MAX_RECORD = 1024 * 1024
+MAX_ERRORS = 100
+
+FORMATS = {
+    'application/json': 'json',
+    'text/csv': 'csv',
+    'application/csv': 'csv',
+    'application/x-ndjson': 'ndjson',
+    'application/ndjson': 'ndjson',
+    'application/jsonl': 'ndjson'
+}
+
+WHITESPACE = re.compile(r'\s*')
+
+
+class TooManyRows(ValueError):
+    pass
+
+
+def integer(value, name, minimum):
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be an integer")
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    elif isinstance(value, str):
+        try:
+            value = int(value.strip())
+        except ValueError:
+            raise ValueError(f"{name} must be an integer") from None
+    elif not isinstance(value, int):
+        raise ValueError(f"{name} must be an integer")
+    if value < minimum:
+        raise ValueError(f"{name} must be at least {minimum}")
+    if value > INT64_MAX:
+        raise ValueError(f"{name} must be at most {INT64_MAX}")
+    return value
+
+
+def row_values(record):
+    # {"arrival", "burst"}, [arrival, burst] or [pid, arrival, burst]; pids are reassigned on append
+    if isinstance(record, dict):
+        if 'arrival' not in record or 'burst' not in record:
+            raise ValueError("arrival and burst are required")
+        arrival, burst = record['arrival'], record['burst']
+    elif isinstance(record, (list, tuple)) and len(record) in (2, 3):
+        arrival, burst = record[-2:]
+    else:
+        raise ValueError("expected an object with arrival and burst, or [arrival, burst]")
+    return integer(arrival, 'arrival', 0), integer(burst, 'burst', 1)
+
+
+def iter_json(stream):
+    reader = io.TextIOWrapper(stream, encoding='utf-8-sig')
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = reader.read(CHUNK)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def peek():
+        nonlocal pos
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            fill()
+
+    if peek() != '[':
+        raise ValueError("expected a JSON array")
+    pos += 1
+    index = 0
+    if peek() == ']':
+        pos += 1
+        if peek():
+            raise ValueError("unexpected data after the JSON array")
+        return
+
+    while True:
+        index += 1
+        peek()
+        while True:
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                end = None
+            # a value that runs to the end of the buffer may continue in the next chunk
+            if end is not None and (end < len(buffer) or eof):
+                break
+            if eof or len(buffer) - pos > MAX_RECORD:
+                raise ValueError(f"malformed JSON in record {index}")
+            fill()
+        pos = end
+        yield index, record
+
+        c = peek()
+        if c == ',':
+            pos += 1
+        elif c == ']':
+            pos += 1
+            if peek():
+                raise ValueError("unexpected data after the JSON array")
+            return
+        else:
+            raise ValueError(f"expected ',' or ']' after record {index}")
+
+
+def iter_ndjson(stream):
+    for line, text in enumerate(io.TextIOWrapper(stream, encoding='utf-8-sig'), 1):
+        text = text.strip()
+        if not text:
+            continue
+        try:
+            yield line, json.loads(text)
+        except json.JSONDecodeError as e:
+            yield line, e
+
+
+def iter_csv(stream):
+    rows = csv.reader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+    columns = None
+    for row in rows:
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        header = [cell.strip().lower() for cell in row]
+        if columns is None:
+            columns = (header.index('arrival'), header.index('burst')) if 'arrival' in header and 'burst' in header else False
+            if columns:
+                continue
+        if not columns:
+            yield rows.line_num, row
+        elif max(columns) < len(row):
+            yield rows.line_num, [row[i] for i in columns]
+        else:
+            yield rows.line_num, ValueError(f"expected {max(columns) + 1} columns")
+
+
+PARSERS = {
+    'json': iter_json,
+    'ndjson': iter_ndjson,
+    'csv': iter_csv
+}
+
+
+def ingest(stream, fmt, maxErrors=MAX_ERRORS, maxRows=None):
+    arrivals = array('q')
+    bursts = array('q')
+    errors = []
+    errorCount = 0
+
+    for row, record in PARSERS[fmt](stream):
+        try:
+            if isinstance(record, Exception):
+                raise ValueError(str(record))
+            arrival, burst = row_values(record)
+        except ValueError as e:
+            errorCount += 1
+            if len(errors) < maxErrors:
+                errors.append({'row': row, 'error': str(e)})
+            continue
+        if maxRows is not None and len(arrivals) >= maxRows:
+            raise TooManyRows(f"more than {maxRows} rows")
+        arrivals.append(arrival)
+        bursts.append(burst)
+
+    return arrivals, bursts, errors, errorCount
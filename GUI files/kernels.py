@@ -0,0 +1,88 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def requireNumpy():
+    if np is None:
+        raise ImportError("kernels requires numpy (pip install numpy)")
+
+
+def prepare(arrival, burst, pid=None):
+    requireNumpy()
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    if arrival.shape != burst.shape or arrival.ndim not in (1, 2):
+        raise ValueError("arrival and burst must be matching 1-D or 2-D arrays")
+
+    single = arrival.ndim == 1
+    arrival = np.atleast_2d(arrival)
+    burst = np.atleast_2d(burst)
+    if pid is None:
+        order = np.argsort(arrival, axis=-1, kind='stable')
+    else:
+        pid = np.broadcast_to(np.asarray(pid, dtype=np.int64), arrival.shape)
+        order = np.lexsort((pid, arrival), axis=-1)
+
+    return (np.take_along_axis(arrival, order, axis=-1),
+            np.take_along_axis(burst, order, axis=-1),
+            order, single)
+
+
+def finish(arrival, burst, start, order, single):
+    complete = start + burst
+    columns = {
+        'completeTime': complete,
+        'turnaround': complete - arrival,
+        'response': start - arrival,
+        'waiting': start - arrival
+    }
+    result = {}
+    for name, sortedColumn in columns.items():
+        column = np.empty_like(sortedColumn)
+        np.put_along_axis(column, order, sortedColumn, axis=-1)
+        result[name] = column[0] if single else column
+
+    averageMetrics = {
+        'averageTurnaroundTime': result['turnaround'].mean(axis=-1),
+        'averageResponseTime': result['response'].mean(axis=-1),
+        'averageWaitingTime': result['waiting'].mean(axis=-1)
+    }
+    if single:
+        averageMetrics = {k: float(v) for k, v in averageMetrics.items()}
+    result['averageMetrics'] = averageMetrics
+    return result
+
+
+def fifo_metrics(arrival, burst, pid=None):
+    arrival, burst, order, single = prepare(arrival, burst, pid)
+    # completion[i] = max(completion[i-1], arrival[i]) + burst[i], unrolled:
+    # completion[i] = S[i] + max over j <= i of (arrival[j] - S[j-1]), S = cumsum(burst)
+    served = np.cumsum(burst, axis=-1)
+    slack = np.maximum(arrival - (served - burst), 0)
+    complete = served + np.maximum.accumulate(slack, axis=-1)
+    return finish(arrival, burst, complete - burst, order, single)
+
+
+def sjf_metrics(arrival, burst, pid=None):
+    arrival, burst, order, single = prepare(arrival, burst, pid)
+    batch, n = arrival.shape
+    rows = np.arange(batch)
+    never = np.iinfo(np.int64).max
+    done = np.zeros(arrival.shape, dtype=bool)
+    start = np.zeros(arrival.shape, dtype=np.int64)
+    time = np.zeros(batch, dtype=np.int64)
+
+    # one dispatch per step across the whole batch; columns are sorted by
+    # (arrival, pid) so argmin's first-hit rule reproduces the (burst, arrival, pid) tie-break
+    for _ in range(n):
+        pending = ~done
+        time = np.maximum(time, np.where(pending, arrival, never).min(axis=-1))
+        ready = pending & (arrival <= time[:, None])
+        pick = np.where(ready, burst, never).argmin(axis=-1)
+        start[rows, pick] = time
+        time = time + burst[rows, pick]
+        done[rows, pick] = True
+
+    return finish(arrival, burst, start, order, single)
@@ -0,0 +1,326 @@
+import heapq
+from collections import deque
+
+from counters import COUNTERS
+from workload import ProcessTable
+
+
+def summarize(table, completion, firstRun):
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    n = len(table)
+    statList = []
+    totalTAT = totalRT = totalWT = 0
+    for i in range(n):
+        arrival, burst = arrivals[i], bursts[i]
+        turnaround = completion[i] - arrival
+        response = firstRun[i] - arrival
+        waiting = turnaround - burst
+        totalTAT += turnaround
+        totalRT += response
+        totalWT += waiting
+        statList.append({
+            'pid': pids[i],
+            'arrival': arrival,
+            'burst': burst,
+            'completeTime': completion[i],
+            'turnaround': turnaround,
+            'response': response,
+            'waiting': waiting
+        })
+
+    averageMetrics = {
+        'averageTurnaroundTime': totalTAT / n,
+        'averageResponseTime': totalRT / n,
+        'averageWaitingTime': totalWT / n
+    }
+    return statList, averageMetrics
+
+
+def average_metrics(table, completion, firstRun):
+    n = len(table)
+    totalTAT = sum(completion) - sum(table.arrival)
+    totalRT = sum(firstRun) - sum(table.arrival)
+    totalWT = totalTAT - sum(table.burst)
+    return {
+        'averageTurnaroundTime': totalTAT / n,
+        'averageResponseTime': totalRT / n,
+        'averageWaitingTime': totalWT / n
+    }
+
+
+def schedule_fifo(table):
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    n = len(table)
+    completion = [0] * n
+    firstRun = [0] * n
+    current = 0
+    idleJumps = 0
+
+    for i in sorted(range(n), key=lambda i: (arrivals[i], pids[i])):
+        if current < arrivals[i]:
+            current = arrivals[i]
+            idleJumps += 1
+        firstRun[i] = current
+        current += bursts[i]
+        completion[i] = current
+
+    if COUNTERS.enabled:
+        COUNTERS.record('metrics', 'FIFO', dispatches=n, contextSwitches=max(n - 1, 0), idleJumps=idleJumps)
+    return completion, firstRun
+
+
+def schedule_sjf(table):
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    completion = [0] * n
+    firstRun = [0] * n
+    ready = []
+    arrivalIndex = 0
+    time = 0
+    idleJumps = 0
+
+    while arrivalIndex < n or ready:
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            i = order[arrivalIndex]
+            heapq.heappush(ready, (bursts[i], arrivals[i], pids[i], i))
+            arrivalIndex += 1
+
+        if not ready:
+            time = arrivals[order[arrivalIndex]]
+            idleJumps += 1
+            continue
+
+        burst, _, _, i = heapq.heappop(ready)
+        firstRun[i] = time
+        time += burst
+        completion[i] = time
+
+    if COUNTERS.enabled:
+        COUNTERS.record('metrics', 'SJF', dispatches=n, contextSwitches=max(n - 1, 0),
+                        idleJumps=idleJumps, heapPushes=n, heapPops=n)
+    return completion, firstRun
+
+
+def schedule_srtf(table):
+    pids, arrivals, bursts = table.pid, table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    completion = [0] * n
+    firstRun = [-1] * n
+    ready = []
+    arrivalIndex = 0
+    current = None
+    time = 0
+    counting = COUNTERS.enabled
+    decisions = switches = idleJumps = 0
+
+    while arrivalIndex < n or ready or current is not None:
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            i = order[arrivalIndex]
+            heapq.heappush(ready, (bursts[i], arrivals[i], pids[i], i))
+            arrivalIndex += 1
+
+        if current is None and not ready:
+            time = arrivals[order[arrivalIndex]]
+            idleJumps += 1
+            continue
+
+        if current is not None:
+            heapq.heappush(ready, current)
+        burstLeft, arrival, pid, i = heapq.heappop(ready)
+        if firstRun[i] < 0:
+            firstRun[i] = time
+        if counting:
+            decisions += 1
+            if current is None or current[3] != i:
+                switches += 1
+
+        if arrivalIndex < n and time + burstLeft > arrivals[order[arrivalIndex]]:
+            nextArrival = arrivals[order[arrivalIndex]]
+            current = (burstLeft - (nextArrival - time), arrival, pid, i)
+            time = nextArrival
+            continue
+
+        time += burstLeft
+        completion[i] = time
+        current = None
+
+    if counting:
+        COUNTERS.record('metrics', 'SRTF', dispatches=decisions, contextSwitches=max(switches - 1, 0),
+                        idleJumps=idleJumps, heapPushes=decisions, heapPops=decisions)
+    return completion, firstRun
+
+
+def schedule_rr(table, quantum=1):
+    arrivals = table.arrival
+    n = len(table)
+    order = table.arrival_order()
+    completion = [0] * n
+    firstRun = [-1] * n
+    remaining = table.burst.tolist()
+    queue = deque()
+    arrivalIndex = 0
+    finished = 0
+    time = 0
+    counting = COUNTERS.enabled
+    dispatches = switches = idleJumps = 0
+    last = None
+
+    def admit():
+        nonlocal arrivalIndex
+        start = arrivalIndex
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            arrivalIndex += 1
+        if arrivalIndex - start > 1:
+            queue.extend(sorted(order[start:arrivalIndex]))
+        elif arrivalIndex > start:
+            queue.append(order[start])
+
+    admit()
+    while finished < n:
+        if not queue:
+            time = arrivals[order[arrivalIndex]]
+            idleJumps += 1
+            admit()
+            continue
+
+        i = queue.popleft()
+        if firstRun[i] < 0:
+            firstRun[i] = time
+        if counting:
+            dispatches += 1
+            if i != last:
+                switches += 1
+                last = i
+
+        if queue:
+            execTime = min(quantum, remaining[i])
+        elif arrivalIndex == n:
+            execTime = remaining[i]
+        else:
+            # a lone job keeps the CPU for whole quanta until the next arrival lands
+            slices = -(-(arrivals[order[arrivalIndex]] - time) // quantum)
+            execTime = min(slices * quantum, remaining[i])
+
+        time += execTime
+        remaining[i] -= execTime
+        admit()
+
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = time
+            finished += 1
+
+    if counting:
+        COUNTERS.record('metrics', 'RR', dispatches=dispatches, contextSwitches=max(switches - 1, 0),
+                        queueOps=2 * dispatches, idleJumps=idleJumps)
+    return completion, firstRun
+
+
+def schedule_mlfq(table, quantums, allotments, boost=None):
+    arrivals = table.arrival
+    totalQueues = len(quantums)
+    order = table.arrival_order()
+    n = len(order)
+    completion = [0] * n
+    firstRun = [-1] * n
+    remaining = table.burst.tolist()
+    allotmentUsed = [0] * n
+    queues = [deque() for _ in range(totalQueues)]
+    arrivalIndex = 0
+    finished = 0
+    time = 0
+    nextBoost = boost if boost else None
+    counting = COUNTERS.enabled
+    dispatches = switches = idleJumps = boosted = 0
+    last = None
+
+    while finished < n:
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            queues[0].append(order[arrivalIndex])
+            arrivalIndex += 1
+
+        if nextBoost is not None and time >= nextBoost:
+            for q in queues[1:]:
+                boosted += len(q)
+                queues[0].extend(q)
+                q.clear()
+            for i in queues[0]:
+                allotmentUsed[i] = 0
+            nextBoost = (time // boost + 1) * boost
+
+        queueLevel = next((level for level, q in enumerate(queues) if q), None)
+
+        if queueLevel is None:
+            time = arrivals[order[arrivalIndex]]
+            idleJumps += 1
+            continue
+
+        i = queues[queueLevel].popleft()
+        if firstRun[i] < 0:
+            firstRun[i] = time
+        if counting:
+            dispatches += 1
+            if i != last:
+                switches += 1
+                last = i
+
+        runTime = min(quantums[queueLevel], remaining[i])
+        time += runTime
+        remaining[i] -= runTime
+
+        while arrivalIndex < n and arrivals[order[arrivalIndex]] <= time:
+            queues[0].append(order[arrivalIndex])
+            arrivalIndex += 1
+
+        if remaining[i] > 0:
+            allotmentUsed[i] += runTime
+            if allotmentUsed[i] >= allotments[queueLevel] and queueLevel < totalQueues - 1:
+                queues[queueLevel + 1].append(i)
+                allotmentUsed[i] = 0
+            else:
+                queues[queueLevel].append(i)
+        else:
+            completion[i] = time
+            finished += 1
+
+    if counting:
+        COUNTERS.record('metrics', 'MLFQ', dispatches=dispatches, contextSwitches=max(switches - 1, 0),
+                        queueOps=2 * dispatches + boosted, idleJumps=idleJumps)
+    return completion, firstRun
+
+
+def fifo(processes):
+    table = ProcessTable.coerce(processes)
+    return summarize(table, *schedule_fifo(table))
+
+
+def sjf(processes):
+    table = ProcessTable.coerce(processes)
+    return summarize(table, *schedule_sjf(table))
+
+
+def srtf(processes):
+    table = ProcessTable.coerce(processes)
+    return summarize(table, *schedule_srtf(table))
+
+
+def rr(processes, quantum=1):
+    table = ProcessTable.coerce(processes)
+    return summarize(table, *schedule_rr(table, quantum))
+
+
+def mlfq(processes, quantums, allotments, boost=None):
+    table = ProcessTable.coerce(processes)
+    return summarize(table, *schedule_mlfq(table, quantums, allotments, boost))
+
+
+ALGORITHMS = {
+    'FIFO': fifo,
+    'SJF': sjf,
+    'SRTF': srtf,
+    'RR': rr,
+    'MLFQ': mlfq
+}
@@ -0,0 +1,120 @@
+import cProfile
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from threading import Lock
+
+# tracemalloc is process-wide, so only one profile runs at a time
+lock = Lock()
+
+
+def frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def builtin_label(function):
+    name = getattr(function, '__qualname__', None) or repr(function)
+    module = getattr(function, '__module__', None)
+    return f"{module}.{name}" if module else name
+
+
+def cpu_profile(function, top):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        function()
+    finally:
+        profiler.disable()
+
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    functions = []
+    for (filename, line, name), (primitiveCalls, calls, totalTime, cumulativeTime, _) in rows[:top]:
+        functions.append({
+            'function': name,
+            'file': filename,
+            'line': line,
+            'calls': calls,
+            'primitiveCalls': primitiveCalls,
+            'totalTime': totalTime,
+            'cumulativeTime': cumulativeTime
+        })
+    return {'totalCalls': stats.total_calls, 'totalTime': stats.total_tt, 'top': functions}
+
+
+def memory_profile(function, top, frames=10):
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(frames)
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__)
+        ))
+        del result
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    sites = []
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        sites.append({'file': frame.filename, 'line': frame.lineno, 'sizeBytes': stat.size, 'count': stat.count})
+    return {'peakBytes': peak - baseline, 'retainedBytes': current - baseline, 'top': sites}
+
+
+def collapsed_stacks(function):
+    # deterministic tracer: self time per unique call stack, in microseconds,
+    # in the "frame;frame;frame weight" format flamegraph.pl and speedscope read
+    clock = time.perf_counter
+    weights = {}
+    path = []
+    marks = []
+
+    def tracer(frame, event, arg):
+        now = clock()
+        if event == 'call':
+            path.append(frame_label(frame.f_code))
+            marks.append([now, 0.0])
+        elif event == 'c_call':
+            path.append(builtin_label(arg))
+            marks.append([now, 0.0])
+        elif path:
+            start, children = marks.pop()
+            elapsed = now - start
+            key = ';'.join(path)
+            weights[key] = weights.get(key, 0.0) + elapsed - children
+            path.pop()
+            if marks:
+                marks[-1][1] += elapsed
+
+    sys.setprofile(tracer)
+    try:
+        function()
+    finally:
+        sys.setprofile(None)
+
+    lines = [f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(weights.items()) if seconds > 0]
+    return '\n'.join(lines) + '\n'
+
+
+def profile_run(function, top=25):
+    # each pass calls function() afresh so the profilers don't distort each other
+    with lock:
+        start = time.perf_counter()
+        function()
+        report = {'wallTime': time.perf_counter() - start}
+        report['cpu'] = cpu_profile(function, top)
+        report['memory'] = memory_profile(function, top)
+        return report
+
+
+def profile_stacks(function):
+    with lock:
+        return collapsed_stacks(function)
@@ -1,3 +1,6 @@
+from tracing import TRACE
+
+
 def fifo(processes):
     processes = sorted(processes, key=lambda p: (p['arrival'], p['pid']))
     current = 0
@@ -310,7 +313,8 @@ def mlfq(processes, quantums, allotments):
                 'executions': []
             }
 
-        print(f"Time {time}: PID {pid} is selected from Queue Level Q{queueLevel}")
+        if TRACE.debug:
+            TRACE.emit('debug', 'dispatch', algorithm='MLFQ', time=time, pid=pid, queueLevel=queueLevel)
 
 
         quantum = quantums[queueLevel]
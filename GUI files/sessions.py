@@ -0,0 +1,229 @@
+import os
+import re
+import secrets
+import time
+from collections import OrderedDict
+from threading import Lock, RLock
+
+from incremental import IncrementalRun
+from store import SQLiteStore, WorkloadFull
+from workload import ProcessTable
+
+# three int64 columns per process
+PROCESS_BYTES = 24
+SESSION_ID = re.compile(r'[A-Za-z0-9_-]{16,64}')
+# how often a persisted session's last-used time is written back
+TOUCH_INTERVAL = 60
+
+
+class SessionFull(Exception):
+    pass
+
+
+class Session:
+    # with a backend the database is authoritative and the in-memory table is a
+    # cache of it, brought up to date by refresh() before every read
+    def __init__(self, sessionId, maxBytes, backend=None):
+        self.id = sessionId
+        self.maxBytes = maxBytes
+        self.backend = backend
+        self.lock = RLock()
+        self.processes = ProcessTable()
+        self.conditions = {'quantum': None, 'allotment': None}
+        self.incremental = {'FIFO': IncrementalRun('FIFO'), 'SJF': IncrementalRun('SJF')}
+        self.epoch = None
+        self.created = self.used = self.touched = time.time()
+
+    def nbytes(self):
+        return len(self.processes) * PROCESS_BYTES
+
+    def reserve(self, count):
+        # callers hold self.lock between reserve() and the append
+        if self.nbytes() + count * PROCESS_BYTES > self.maxBytes:
+            raise SessionFull(f"session workload limit is {self.maxBytes // PROCESS_BYTES} processes")
+
+    def room(self):
+        with self.lock:
+            self.refresh()
+            return (self.maxBytes - self.nbytes()) // PROCESS_BYTES
+
+    def reset(self):
+        self.processes.clear()
+        for run in self.incremental.values():
+            run.reset()
+
+    def refresh(self):
+        # callers hold self.lock; only rows past the cached prefix are read unless the workload was cleared
+        if self.backend is None:
+            return
+        with self.backend.reading():
+            state = self.backend.state(self.id)
+            if state is not None:
+                epoch, count, version, conditions = state
+                if epoch != self.epoch or count < len(self.processes):
+                    self.reset()
+                    self.epoch = epoch
+                if count > len(self.processes):
+                    for pids, arrivals, bursts in self.backend.rows(self.id, len(self.processes)):
+                        self.processes.extend(pids, arrivals, bursts)
+        if state is None:
+            # expired from the database while cached here
+            self.backend.create(self.id)
+            self.reset()
+            epoch, count, version, conditions = self.backend.state(self.id)
+            self.epoch = epoch
+        self.processes.version = version
+        self.conditions = {'quantum': None, 'allotment': None, **conditions}
+
+    def add(self, arrivals, bursts, replace=False):
+        # with replace the old workload is dropped only once the new one is known to fit
+        with self.lock:
+            if self.backend is None:
+                if replace:
+                    if len(arrivals) * PROCESS_BYTES > self.maxBytes:
+                        raise SessionFull(f"session workload limit is {self.maxBytes // PROCESS_BYTES} processes")
+                    self.reset()
+                self.reserve(len(arrivals))
+                first = len(self.processes) + 1
+                self.processes.extend(range(first, first + len(arrivals)), arrivals, bursts)
+                return len(self.processes), self.processes.version
+
+            self.refresh()
+            try:
+                epoch, first, count, version = self.backend.append(self.id, arrivals, bursts,
+                                                                   self.maxBytes // PROCESS_BYTES, replace)
+            except WorkloadFull as e:
+                raise SessionFull(str(e)) from None
+            if replace:
+                self.reset()
+                self.epoch = epoch
+            if epoch == self.epoch and first == len(self.processes) + 1:
+                self.processes.extend(range(first, count + 1), arrivals, bursts)
+                self.processes.version = version
+            else:
+                self.refresh()
+            return count, version
+
+    def clear(self):
+        with self.lock:
+            if self.backend is not None:
+                self.refresh()
+                self.epoch, version = self.backend.clear(self.id)
+            self.reset()
+            if self.backend is not None:
+                self.processes.version = version
+
+    def set_conditions(self, quantum, allotment):
+        with self.lock:
+            self.conditions['quantum'] = quantum
+            self.conditions['allotment'] = allotment
+            if self.backend is not None:
+                self.backend.set_conditions(self.id, self.conditions)
+
+    def snapshot(self):
+        # a private copy, so long runs don't hold the lock against writers
+        with self.lock:
+            self.refresh()
+            self.processes.digest()
+            return self.processes.copy()
+
+    def info(self):
+        with self.lock:
+            self.refresh()
+            return {
+                'id': self.id,
+                'processes': len(self.processes),
+                'version': self.processes.version,
+                'bytes': self.nbytes(),
+                'maxBytes': self.maxBytes,
+                'conditions': dict(self.conditions),
+                'created': self.created,
+                'used': self.used
+            }
+
+
+class SessionStore:
+    def __init__(self, maxSessions=256, maxBytes=64 * 1024 * 1024, idleTimeout=3600, backend=None):
+        self.maxSessions = maxSessions
+        self.maxBytes = maxBytes
+        self.idleTimeout = idleTimeout
+        self.backend = backend
+        self.sessions = OrderedDict()
+        self.evicted = 0
+        self.lock = Lock()
+
+    def expire(self, now):
+        # least recently used first, so stop at the first live session; with a
+        # backend this only drops the cached copy
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if now - session.used < self.idleTimeout and len(self.sessions) <= self.maxSessions:
+                break
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+
+    def get(self, sessionId=None, create=True):
+        # returns (session, created); unknown or malformed ids get a fresh session,
+        # or (None, False) when create is off
+        now = time.time()
+        valid = bool(sessionId) and SESSION_ID.fullmatch(sessionId) is not None
+        with self.lock:
+            session = self.sessions.get(sessionId) if valid else None
+            created = False
+            if session is None:
+                if valid and self.backend is not None and self.backend.exists(sessionId):
+                    # persisted by another worker, or before a restart
+                    session = Session(sessionId, self.maxBytes, self.backend)
+                elif not create:
+                    return None, False
+                else:
+                    session = Session(secrets.token_urlsafe(24), self.maxBytes, self.backend)
+                    created = True
+                    if self.backend is not None:
+                        self.backend.expire(self.idleTimeout)
+                        self.backend.create(session.id)
+                self.sessions[session.id] = session
+            else:
+                self.sessions.move_to_end(sessionId)
+            session.used = now
+            self.expire(now)
+        if self.backend is not None and now - session.touched > TOUCH_INTERVAL:
+            session.touched = now
+            self.backend.touch(session.id)
+        return session, created
+
+    def drop(self, sessionId):
+        with self.lock:
+            dropped = self.sessions.pop(sessionId, None) is not None
+        if self.backend is not None:
+            self.backend.drop(sessionId)
+        return dropped
+
+    def get_run(self, key):
+        return self.backend.get_run(key) if self.backend is not None else None
+
+    def put_run(self, key, algorithm, processes, body):
+        if self.backend is not None:
+            self.backend.put_run(key, algorithm, processes, body)
+
+    def info(self):
+        with self.lock:
+            info = {
+                'sessions': len(self.sessions),
+                'maxSessions': self.maxSessions,
+                'maxBytes': self.maxBytes,
+                'idleTimeout': self.idleTimeout,
+                'evicted': self.evicted,
+                'processes': sum(len(s.processes) for s in self.sessions.values())
+            }
+        if self.backend is not None:
+            info['database'] = self.backend.info()
+        return info
+
+
+SESSIONS = SessionStore(
+    int(os.environ.get('SCHEDULER_MAX_SESSIONS', 256)),
+    int(os.environ.get('SCHEDULER_SESSION_MAX_BYTES', 64 * 1024 * 1024)),
+    float(os.environ.get('SCHEDULER_SESSION_TIMEOUT', 3600)),
+    SQLiteStore(os.environ['SCHEDULER_DB']) if os.environ.get('SCHEDULER_DB') else None
+)
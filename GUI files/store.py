@@ -0,0 +1,177 @@
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from itertools import repeat
+
+BATCH = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workloads (
+    id TEXT PRIMARY KEY,
+    epoch INTEGER NOT NULL DEFAULT 0,
+    count INTEGER NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0,
+    conditions TEXT NOT NULL DEFAULT '{}',
+    created REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workloads_used ON workloads (used);
+CREATE TABLE IF NOT EXISTS processes (
+    workload TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    arrival INTEGER NOT NULL,
+    burst INTEGER NOT NULL,
+    PRIMARY KEY (workload, pid)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    processes INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created);
+"""
+
+
+class WorkloadFull(Exception):
+    pass
+
+
+class SQLiteStore:
+    # one connection per thread; WAL lets readers in every worker run alongside
+    # the single writer, and BEGIN IMMEDIATE serialises writers across processes
+    def __init__(self, path, maxRuns=1024, timeout=30):
+        self.path = path
+        self.maxRuns = maxRuns
+        self.timeout = timeout
+        self.local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        db = getattr(self.local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self.local.db = db
+        return db
+
+    def transaction(self):
+        return Transaction(self.connection())
+
+    def reading(self):
+        # a read snapshot, so state() and rows() agree even while another worker writes
+        return Transaction(self.connection(), 'BEGIN')
+
+    def create(self, workloadId):
+        now = time.time()
+        with self.transaction() as db:
+            db.execute('INSERT OR IGNORE INTO workloads (id, created, used) VALUES (?, ?, ?)',
+                       (workloadId, now, now))
+
+    def exists(self, workloadId):
+        return self.connection().execute('SELECT 1 FROM workloads WHERE id = ?', (workloadId,)).fetchone() is not None
+
+    def state(self, workloadId):
+        # (epoch, count, version, conditions) or None; epoch changes whenever the workload is cleared
+        row = self.connection().execute('SELECT epoch, count, version, conditions FROM workloads WHERE id = ?',
+                                        (workloadId,)).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], row[2], json.loads(row[3])
+
+    def touch(self, workloadId):
+        with self.transaction() as db:
+            db.execute('UPDATE workloads SET used = ? WHERE id = ?', (time.time(), workloadId))
+
+    def append(self, workloadId, arrivals, bursts, maxCount=None, replace=False):
+        # returns (epoch, first pid, count, version); replace clears the workload in the same transaction
+        with self.transaction() as db:
+            row = db.execute('SELECT epoch, count, version FROM workloads WHERE id = ?', (workloadId,)).fetchone()
+            if row is None:
+                raise KeyError(workloadId)
+            epoch, count, version = row
+            added = len(arrivals)
+            if maxCount is not None and (0 if replace else count) + added > maxCount:
+                raise WorkloadFull(f"session workload limit is {maxCount} processes")
+            if replace:
+                db.execute('DELETE FROM processes WHERE workload = ?', (workloadId,))
+                db.execute('UPDATE workloads SET epoch = ? WHERE id = ?', (epoch + 1, workloadId))
+                epoch, count = epoch + 1, 0
+            db.executemany('INSERT INTO processes (workload, pid, arrival, burst) VALUES (?, ?, ?, ?)',
+                           zip(repeat(workloadId), range(count + 1, count + added + 1), arrivals, bursts))
+            db.execute('UPDATE workloads SET count = ?, version = ?, used = ? WHERE id = ?',
+                       (count + added, version + 1, time.time(), workloadId))
+        return epoch, count + 1, count + added, version + 1
+
+    def clear(self, workloadId):
+        with self.transaction() as db:
+            db.execute('DELETE FROM processes WHERE workload = ?', (workloadId,))
+            db.execute('UPDATE workloads SET epoch = epoch + 1, count = 0, version = version + 1, used = ? '
+                       'WHERE id = ?', (time.time(), workloadId))
+            return db.execute('SELECT epoch, version FROM workloads WHERE id = ?', (workloadId,)).fetchone()
+
+    def set_conditions(self, workloadId, conditions):
+        with self.transaction() as db:
+            db.execute('UPDATE workloads SET conditions = ? WHERE id = ?', (json.dumps(conditions), workloadId))
+
+    def rows(self, workloadId, after=0):
+        # streams (pid, arrival, burst) column batches in pid order, starting after pid `after`
+        cursor = self.connection().execute(
+            'SELECT pid, arrival, burst FROM processes WHERE workload = ? AND pid > ? ORDER BY pid',
+            (workloadId, after))
+        while True:
+            batch = cursor.fetchmany(BATCH)
+            if not batch:
+                return
+            pids, arrivals, bursts = zip(*batch)
+            yield array('q', pids), array('q', arrivals), array('q', bursts)
+
+    def drop(self, workloadId):
+        with self.transaction() as db:
+            db.execute('DELETE FROM processes WHERE workload = ?', (workloadId,))
+            db.execute('DELETE FROM workloads WHERE id = ?', (workloadId,))
+
+    def expire(self, idleTimeout):
+        cutoff = time.time() - idleTimeout
+        with self.transaction() as db:
+            db.execute('DELETE FROM processes WHERE workload IN (SELECT id FROM workloads WHERE used < ?)', (cutoff,))
+            return db.execute('DELETE FROM workloads WHERE used < ?', (cutoff,)).rowcount
+
+    def get_run(self, key):
+        row = self.connection().execute('SELECT body FROM runs WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def put_run(self, key, algorithm, processes, body):
+        with self.transaction() as db:
+            db.execute('INSERT OR REPLACE INTO runs (key, algorithm, processes, body, created) VALUES (?, ?, ?, ?, ?)',
+                       (key, algorithm, processes, body, time.time()))
+            db.execute('DELETE FROM runs WHERE key IN (SELECT key FROM runs ORDER BY created DESC LIMIT -1 OFFSET ?)',
+                       (self.maxRuns,))
+
+    def info(self):
+        db = self.connection()
+        workloads, processes = db.execute('SELECT COUNT(*), COALESCE(SUM(count), 0) FROM workloads').fetchone()
+        return {
+            'path': self.path,
+            'workloads': workloads,
+            'processes': processes,
+            'runs': db.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+        }
+
+
+class Transaction:
+    def __init__(self, db, begin='BEGIN IMMEDIATE'):
+        self.db = db
+        self.begin = begin
+
+    def __enter__(self):
+        self.db.execute(self.begin)
+        return self.db
+
+    def __exit__(self, kind, value, traceback):
+        self.db.execute('ROLLBACK' if kind else 'COMMIT')
+        return False
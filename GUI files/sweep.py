@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import metrics
+from tracefile import load_workload
+from workload import ProcessTable
+
+sharedTable = None
+
+
+def init_worker(table):
+    global sharedTable
+    sharedTable = table
+
+
+def level_values(base, growth, queues):
+    return [base * growth ** level for level in range(queues)]
+
+
+def canonical(config, maxBurst, growth):
+    # collapse grid points that provably produce the same schedule:
+    # slices never exceed the longest burst, and an allotment of maxBurst or
+    # more is never used up, so no job leaves the top queue
+    algorithm, quantum, allotment, queues = config
+    if algorithm == 'RR':
+        return ('RR', min(quantum, maxBurst), None, None)
+    if allotment >= maxBurst or queues == 1:
+        return ('MLFQ', min(quantum, maxBurst), maxBurst, 1)
+    quantums = tuple(min(q, maxBurst) for q in level_values(quantum, growth, queues))
+    return ('MLFQ', quantums, allotment, queues)
+
+
+def evaluate(config, growth=1, boost=None, table=None):
+    table = table if table is not None else sharedTable
+    algorithm, quantum, allotment, queues = config
+    if algorithm == 'RR':
+        times = metrics.schedule_rr(table, quantum)
+    else:
+        quantums = list(quantum) if isinstance(quantum, tuple) else level_values(quantum, growth, queues)
+        times = metrics.schedule_mlfq(table, quantums, [allotment] * queues, boost)
+    return metrics.average_metrics(table, *times)
+
+
+def evaluate_task(task):
+    config, growth, boost = task
+    return evaluate(config, growth, boost)
+
+
+def pareto(surface):
+    front = []
+    bestResponse = None
+    for point in sorted(surface, key=lambda p: (p['averageWaitingTime'], p['averageResponseTime'])):
+        if bestResponse is None or point['averageResponseTime'] < bestResponse:
+            front.append(point)
+            bestResponse = point['averageResponseTime']
+    return front
+
+
+def sweep(processes, quantums, allotments=(1,), queueCounts=(4,), algorithms=('RR', 'MLFQ'),
+          growth=1, boost=None, workers=None):
+    table = ProcessTable.coerce(processes)
+    if not len(table):
+        raise ValueError("cannot sweep an empty workload")
+    table.arrival_order()
+    maxBurst = max(table.burst)
+
+    grid = []
+    for algorithm in algorithms:
+        if algorithm == 'RR':
+            grid += [('RR', q, None, None) for q in quantums]
+        elif algorithm == 'MLFQ':
+            grid += [('MLFQ', q, a, k) for q in quantums for a in allotments for k in queueCounts]
+        else:
+            raise ValueError(f"sweep supports RR and MLFQ, not {algorithm}")
+
+    keys = [canonical(config, maxBurst, growth) for config in grid]
+    unique = list(dict.fromkeys(keys))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(unique) == 1:
+        results = [evaluate(config, growth, boost, table) for config in unique]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(table,)) as pool:
+            tasks = [(config, growth, boost) for config in unique]
+            results = list(pool.map(evaluate_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    byKey = dict(zip(unique, results))
+
+    surface = []
+    for (algorithm, quantum, allotment, queues), key in zip(grid, keys):
+        point = {'algorithm': algorithm, 'quantum': quantum, 'allotment': allotment, 'queues': queues}
+        point.update(byKey[key])
+        surface.append(point)
+
+    return {
+        'surface': surface,
+        'pareto': pareto(surface),
+        'evaluated': len(unique),
+        'gridSize': len(grid)
+    }
+
+
+def parse_range(text):
+    if ':' in text:
+        parts = [int(v) for v in text.split(':')]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) > 2 else 1
+        return list(range(start, stop + 1, step))
+    return [int(v) for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep RR/MLFQ parameters over a workload.")
+    parser.add_argument('workload', help="binary workload file, or JSON/NDJSON/CSV of {arrival, burst} rows")
+    parser.add_argument('--quantum', default='1:10', help="range start:stop[:step] or list a,b,c")
+    parser.add_argument('--allotment', default='1', help="range or list of allotments (MLFQ)")
+    parser.add_argument('--queues', default='4', help="range or list of queue counts (MLFQ)")
+    parser.add_argument('--growth', type=int, default=1, help="per-level quantum multiplier (MLFQ)")
+    parser.add_argument('--boost', type=int, default=None, help="priority boost period (MLFQ)")
+    parser.add_argument('--algorithms', default='RR,MLFQ')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--pareto-only', action='store_true')
+    args = parser.parse_args()
+
+    result = sweep(load_workload(args.workload), parse_range(args.quantum), parse_range(args.allotment),
+                   parse_range(args.queues), args.algorithms.split(','),
+                   args.growth, args.boost, args.workers)
+    if args.pareto_only:
+        result = result['pareto']
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from ingest import ingest
+from workload import ProcessTable
+
+# header: magic, format version, flags (reserved, 0), process count, reserved;
+# then three little-endian int64 columns, pid, arrival, burst, of `count` values each
+MAGIC = b'SCHEDWL\x00'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sIIQQ')
+COLUMNS = ('pid', 'arrival', 'burst')
+TEXT_FORMATS = {'.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.csv': 'csv'}
+
+
+def write_workload(path, processes):
+    table = ProcessTable.coerce(processes)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(table), 0))
+        for name in COLUMNS:
+            column = getattr(table, name)
+            if sys.byteorder != 'little':
+                column = array('q', column)
+                column.byteswap()
+            f.write(memoryview(column).cast('B'))
+    return len(table)
+
+
+def read_header(buffer, size):
+    if size < HEADER.size:
+        raise ValueError("file is too small to be a workload")
+    magic, version, _, count, _ = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("not a binary workload file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported workload format version {version}")
+    if size != HEADER.size + 8 * len(COLUMNS) * count:
+        raise ValueError(f"workload header says {count} processes but the file size doesn't match")
+    return count
+
+
+def open_workload(path):
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < HEADER.size:
+            raise ValueError("file is too small to be a workload")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        count = read_header(mapped, size)
+    except Exception:
+        mapped.close()
+        raise
+    width = 8 * count
+    offsets = [HEADER.size + k * width for k in range(len(COLUMNS))]
+
+    if sys.byteorder != 'little':
+        columns = []
+        for offset in offsets:
+            column = array('q')
+            column.frombytes(mapped[offset:offset + width])
+            column.byteswap()
+            columns.append(column)
+        mapped.close()
+        return ProcessTable.from_columns(*columns)
+
+    # zero-copy: the views keep the mapping alive and page data in on demand
+    view = memoryview(mapped)
+    return ProcessTable.from_columns(*(view[offset:offset + width].cast('q') for offset in offsets))
+
+
+def is_workload_file(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_workload(path):
+    if is_workload_file(path):
+        return open_workload(path)
+    if '.swf' in os.path.basename(path).lower():
+        from traceimport import Importer, open_trace, read_swf
+        with open_trace(path) as lines:
+            return read_swf(lines, Importer())[0]
+    fmt = TEXT_FORMATS.get(os.path.splitext(path)[1].lower(), 'json')
+    with open(path, 'rb') as f:
+        arrivals, bursts, errors, errorCount = ingest(f, fmt)
+    if errorCount:
+        raise ValueError(f"{path}: {errorCount} invalid rows, first: row {errors[0]['row']}: {errors[0]['error']}")
+    return ProcessTable(range(1, len(arrivals) + 1), arrivals, bursts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert and inspect binary workload files.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help="JSON/NDJSON/CSV to binary, or binary to JSON")
+    convert.add_argument('source')
+    convert.add_argument('destination')
+    info = commands.add_parser('info', help="print the header and column ranges of a workload")
+    info.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        table = load_workload(args.source)
+        if args.destination.lower().endswith('.json'):
+            with open(args.destination, 'w') as f:
+                json.dump(table.to_dicts(), f)
+        else:
+            write_workload(args.destination, table)
+        print(f"wrote {len(table)} processes to {args.destination}", file=sys.stderr)
+    else:
+        table = open_workload(args.path)
+        summary = {'processes': len(table), 'formatVersion': FORMAT_VERSION}
+        if len(table):
+            summary.update({
+                'arrival': [min(table.arrival), max(table.arrival)],
+                'burst': [min(table.burst), max(table.burst)],
+                'totalBurst': sum(table.burst)
+            })
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+import argparse
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import sys
+from array import array
+
+from tracefile import write_workload
+from workload import ProcessTable
+
+OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+# Standard Workload Format columns (0-based); -1 marks a missing value
+SWF_SUBMIT = 1
+SWF_RUNTIME = 3
+SWF_STATUS = 10
+SWF_QUEUE = 14
+SWF_PARTITION = 15
+
+
+def open_trace(path):
+    for suffix, opener in OPENERS.items():
+        if path.endswith(suffix):
+            return opener(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, encoding='utf-8', errors='replace')
+
+
+class Importer:
+    # scale is trace time units per simulator tick: arrivals are floored and
+    # bursts rounded up, so a job never shrinks to zero
+    def __init__(self, scale=1, minBurst=None, maxBurst=None, since=None, until=None, limit=None, rebase=True):
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        self.scale = scale
+        self.minBurst = minBurst
+        self.maxBurst = maxBurst
+        self.since = since
+        self.until = until
+        self.limit = limit
+        self.rebase = rebase
+        self.arrivals = array('q')
+        self.bursts = array('q')
+        self.read = 0
+        self.skipped = {}
+
+    def skip(self, reason):
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    def full(self):
+        return self.limit is not None and len(self.arrivals) >= self.limit
+
+    def add(self, submit, runtime):
+        if runtime <= 0:
+            self.skip('no runtime')
+            return
+        if submit < 0:
+            self.skip('no submit time')
+            return
+        if (self.since is not None and submit < self.since) or (self.until is not None and submit >= self.until):
+            self.skip('outside time window')
+            return
+        burst = max(1, int(-(-runtime // self.scale)))
+        if (self.minBurst is not None and burst < self.minBurst) or (self.maxBurst is not None and burst > self.maxBurst):
+            self.skip('burst filtered')
+            return
+        self.arrivals.append(int(submit // self.scale))
+        self.bursts.append(burst)
+
+    def finish(self):
+        arrivals = self.arrivals
+        if self.rebase and arrivals:
+            origin = min(arrivals)
+            if origin:
+                arrivals = array('q', (a - origin for a in arrivals))
+        table = ProcessTable.from_columns(array('q', range(1, len(arrivals) + 1)), arrivals, self.bursts)
+        report = {'read': self.read, 'imported': len(table), 'skipped': self.skipped}
+        return table, report
+
+
+def read_swf(lines, importer, statuses=None, queues=None, partitions=None):
+    for line in lines:
+        if importer.full():
+            break
+        line = line.strip()
+        if not line or line.startswith(';'):
+            continue
+        importer.read += 1
+        fields = line.split()
+        try:
+            submit = float(fields[SWF_SUBMIT])
+            runtime = float(fields[SWF_RUNTIME])
+            status = int(fields[SWF_STATUS]) if statuses is not None else None
+            queue = int(fields[SWF_QUEUE]) if queues is not None else None
+            partition = int(fields[SWF_PARTITION]) if partitions is not None else None
+        except (IndexError, ValueError):
+            importer.skip('malformed')
+            continue
+        if statuses is not None and status not in statuses:
+            importer.skip('status filtered')
+            continue
+        if queues is not None and queue not in queues:
+            importer.skip('queue filtered')
+            continue
+        if partitions is not None and partition not in partitions:
+            importer.skip('partition filtered')
+            continue
+        importer.add(submit, runtime)
+    return importer.finish()
+
+
+def column_index(spec, header):
+    if spec is None:
+        return None
+    if isinstance(spec, int) or spec.isdigit():
+        return int(spec)
+    if header is None or spec not in header:
+        raise ValueError(f"column {spec!r} not found in the CSV header")
+    return header.index(spec)
+
+
+def read_csv(lines, importer, arrival, burst=None, start=None, end=None, delimiter=',', header=True):
+    # burst comes from a runtime column, or from end - start (start defaults to the arrival column)
+    if burst is None and end is None:
+        raise ValueError("need a burst column or an end column")
+    rows = csv.reader(lines, delimiter=delimiter)
+    names = [name.strip() for name in next(rows, [])] if header else None
+    arrivalIndex = column_index(arrival, names)
+    burstIndex = column_index(burst, names)
+    startIndex = column_index(start if start is not None else arrival, names)
+    endIndex = column_index(end, names)
+
+    for row in rows:
+        if importer.full():
+            break
+        if not row:
+            continue
+        importer.read += 1
+        try:
+            submit = float(row[arrivalIndex])
+            if burstIndex is not None:
+                runtime = float(row[burstIndex])
+            else:
+                runtime = float(row[endIndex]) - float(row[startIndex])
+        except (IndexError, ValueError):
+            importer.skip('malformed')
+            continue
+        importer.add(submit, runtime)
+    return importer.finish()
+
+
+def int_set(text):
+    return {int(v) for v in text.split(',') if v.strip()} if text else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import SWF or cluster-trace CSV files as workloads.")
+    parser.add_argument('format', choices=('swf', 'csv'))
+    parser.add_argument('trace', help="trace file, optionally .gz/.bz2/.xz compressed")
+    parser.add_argument('output', help="binary workload file to write, or .json")
+    parser.add_argument('--scale', type=float, default=1, help="trace time units per simulator tick")
+    parser.add_argument('--min-burst', type=int)
+    parser.add_argument('--max-burst', type=int)
+    parser.add_argument('--since', type=float, help="skip jobs submitted before this trace time")
+    parser.add_argument('--until', type=float, help="skip jobs submitted at or after this trace time")
+    parser.add_argument('--limit', type=int, help="stop after this many jobs")
+    parser.add_argument('--no-rebase', action='store_true', help="keep absolute arrival times")
+    parser.add_argument('--status', help="SWF: comma-separated statuses to keep, e.g. 1 for completed jobs")
+    parser.add_argument('--queue', help="SWF: comma-separated queue numbers to keep")
+    parser.add_argument('--partition', help="SWF: comma-separated partition numbers to keep")
+    parser.add_argument('--arrival-column', default='submit_time', help="CSV: name or index of the submit column")
+    parser.add_argument('--burst-column', help="CSV: name or index of the runtime column")
+    parser.add_argument('--start-column', help="CSV: start column for end - start runtimes")
+    parser.add_argument('--end-column', help="CSV: end column for end - start runtimes")
+    parser.add_argument('--delimiter', default=',')
+    parser.add_argument('--no-header', action='store_true', help="CSV: columns are given by index")
+    args = parser.parse_args()
+
+    importer = Importer(args.scale, args.min_burst, args.max_burst, args.since, args.until, args.limit,
+                        not args.no_rebase)
+    with open_trace(args.trace) as lines:
+        if args.format == 'swf':
+            table, report = read_swf(lines, importer, int_set(args.status), int_set(args.queue),
+                                     int_set(args.partition))
+        else:
+            table, report = read_csv(lines, importer, args.arrival_column, args.burst_column,
+                                     args.start_column, args.end_column, args.delimiter, not args.no_header)
+
+    if args.output.lower().endswith('.json'):
+        with open(args.output, 'w') as f:
+            json.dump(table.to_dicts(), f)
+    else:
+        write_workload(args.output, table)
+    json.dump(report, sys.stderr, indent=2)
+    print(file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
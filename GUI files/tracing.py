@@ -0,0 +1,76 @@
+import os
+import random
+import time
+from collections import deque
+from threading import Lock
+
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+OFF = 'off'
+
+
+class Tracer:
+    # call sites test the per-level flags (TRACE.debug, TRACE.info, ...) before
+    # building a record, so a disabled level costs one attribute load
+    def __init__(self, level=OFF, sample=1.0, capacity=1000):
+        self.lock = Lock()
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self.configure(level, sample)
+
+    def configure(self, level=None, sample=None, capacity=None):
+        if level is not None:
+            if level != OFF and level not in LEVELS:
+                raise ValueError(f"unknown trace level {level}")
+            self.level = level
+            threshold = LEVELS.get(level, float('inf'))
+            for name, value in LEVELS.items():
+                setattr(self, name, value >= threshold)
+        if sample is not None:
+            if not 0 < sample <= 1:
+                raise ValueError("sample must be in (0, 1]")
+            self.sample = sample
+        if capacity is not None:
+            if capacity < 1:
+                raise ValueError("capacity must be positive")
+            with self.lock:
+                self.buffer = deque(self.buffer, maxlen=capacity)
+
+    def emit(self, level, message, **fields):
+        # under the lock, since configure() may be swapping the buffer
+        if self.sample < 1 and random.random() >= self.sample:
+            with self.lock:
+                self.dropped += 1
+            return
+        fields['ts'] = time.time()
+        fields['level'] = level
+        fields['message'] = message
+        with self.lock:
+            self.buffer.append(fields)
+
+    def recent(self, limit=None, level=None):
+        with self.lock:
+            records = list(self.buffer)
+        if level is not None:
+            records = [r for r in records if LEVELS[r['level']] >= LEVELS[level]]
+        return records[-limit:] if limit else records
+
+    def clear(self):
+        with self.lock:
+            self.buffer.clear()
+            self.dropped = 0
+
+    def status(self):
+        return {
+            'level': self.level,
+            'sample': self.sample,
+            'capacity': self.buffer.maxlen,
+            'size': len(self.buffer),
+            'dropped': self.dropped
+        }
+
+
+TRACE = Tracer(
+    os.environ.get('SCHEDULER_TRACE', OFF).lower(),
+    float(os.environ.get('SCHEDULER_TRACE_SAMPLE', 1.0)),
+    int(os.environ.get('SCHEDULER_TRACE_CAPACITY', 1000))
+)
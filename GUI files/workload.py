@@ -0,0 +1,143 @@
+import hashlib
+from array import array
+
+# columns are array('q'), so every value must fit in a signed 64-bit integer
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+class ProcessRecord:
+    __slots__ = ('pid', 'arrival', 'burst')
+
+    def __init__(self, pid, arrival, burst):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f"ProcessRecord(pid={self.pid}, arrival={self.arrival}, burst={self.burst})"
+
+    def to_dict(self):
+        return {'pid': self.pid, 'arrival': self.arrival, 'burst': self.burst}
+
+
+class ProcessTable:
+    __slots__ = ('pid', 'arrival', 'burst', 'order', 'fingerprint', 'version')
+
+    def __init__(self, pid=(), arrival=(), burst=()):
+        self.pid = array('q', pid)
+        self.arrival = array('q', arrival)
+        self.burst = array('q', burst)
+        self.order = None
+        self.fingerprint = None
+        self.version = 0
+        if not len(self.pid) == len(self.arrival) == len(self.burst):
+            raise ValueError("pid, arrival and burst columns must have the same length")
+
+    @classmethod
+    def from_dicts(cls, processes):
+        table = cls()
+        for p in processes:
+            table.append(p['pid'], p['arrival'], p['burst'])
+        return table
+
+    @classmethod
+    def from_columns(cls, pid, arrival, burst):
+        # adopts the columns as-is (e.g. read-only memoryviews over an mmap) instead of copying
+        if not len(pid) == len(arrival) == len(burst):
+            raise ValueError("pid, arrival and burst columns must have the same length")
+        table = cls.__new__(cls)
+        table.pid = pid
+        table.arrival = arrival
+        table.burst = burst
+        table.order = None
+        table.fingerprint = None
+        table.version = 0
+        return table
+
+    @classmethod
+    def coerce(cls, processes):
+        if isinstance(processes, cls):
+            return processes
+        return cls.from_dicts(processes)
+
+    def append(self, pid, arrival, burst):
+        self.extend((pid,), (arrival,), (burst,))
+
+    def rollback(self, length):
+        del self.pid[length:]
+        del self.arrival[length:]
+        del self.burst[length:]
+
+    def extend(self, pid, arrival, burst):
+        # all three columns grow or none do, even if a value doesn't fit in int64
+        before = len(self.pid)
+        try:
+            self.pid.extend(pid)
+            self.arrival.extend(arrival)
+            self.burst.extend(burst)
+        except BaseException:
+            self.rollback(before)
+            raise
+        if not len(self.pid) == len(self.arrival) == len(self.burst):
+            self.rollback(before)
+            raise ValueError("pid, arrival and burst columns must have the same length")
+        self.order = None
+        self.fingerprint = None
+        self.version += 1
+
+    def clear(self):
+        del self.pid[:]
+        del self.arrival[:]
+        del self.burst[:]
+        self.order = None
+        self.fingerprint = None
+        self.version += 1
+
+    def copy(self):
+        table = ProcessTable()
+        table.pid.frombytes(memoryview(self.pid).cast('B'))
+        table.arrival.frombytes(memoryview(self.arrival).cast('B'))
+        table.burst.frombytes(memoryview(self.burst).cast('B'))
+        table.version = self.version
+        table.fingerprint = self.fingerprint
+        return table
+
+    def __reduce__(self):
+        # mmap-backed columns are memoryviews, which can't be pickled; ship array copies,
+        # along with the cached order and digest so workers don't recompute them
+        table = self.copy()
+        state = {'order': self.order, 'fingerprint': self.fingerprint, 'version': self.version}
+        return (ProcessTable.from_columns, (table.pid, table.arrival, table.burst), (None, state))
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, i):
+        return ProcessRecord(self.pid[i], self.arrival[i], self.burst[i])
+
+    def __iter__(self):
+        for i in range(len(self.pid)):
+            yield ProcessRecord(self.pid[i], self.arrival[i], self.burst[i])
+
+    def arrival_order(self):
+        if self.order is None:
+            self.order = sorted(range(len(self.pid)), key=self.arrival.__getitem__)
+        return self.order
+
+    def digest(self):
+        if self.fingerprint is None:
+            h = hashlib.blake2b(digest_size=16)
+            for column in (self.pid, self.arrival, self.burst):
+                h.update(column.tobytes())
+            self.fingerprint = h.hexdigest()
+        return self.fingerprint
+
+    def to_dicts(self):
+        return [{'pid': pid, 'arrival': arrival, 'burst': burst}
+                for pid, arrival, burst in zip(self.pid, self.arrival, self.burst)]
@@ -3,6 +3,8 @@
 import random
 import sys
 
+VERBOSE = '--verbose' in sys.argv[1:]
+
 def makeProcess():
     processes = []
     inputChoice = input("Do you want a [M]ANUAL or [R]ANDOM process generation? [M/R]: ").strip().upper()
@@ -80,13 +82,14 @@ def roundRobin(processes):
             stats[pid]['completeTime'] = time
             stats[pid]['turnaround'] = time - arrival
             stats[pid]['response'] = stats[pid]['startTime'] - arrival
-            print(f"\nProcess P{pid} finished:")
-            print(f"  Arrival Time   : {arrival}")
-            print(f"  Burst Time     : {current['burst']}")
-            print(f"  Start Time     : {stats[pid]['startTime']}")
-            print(f"  Completion Time: {time}")
-            print(f"  Turnaround Time: {stats[pid]['turnaround']}")
-            print(f"  Response Time  : {stats[pid]['response']}\n")
+            if VERBOSE:
+                print(f"\nProcess P{pid} finished:")
+                print(f"  Arrival Time   : {arrival}")
+                print(f"  Burst Time     : {current['burst']}")
+                print(f"  Start Time     : {stats[pid]['startTime']}")
+                print(f"  Completion Time: {time}")
+                print(f"  Turnaround Time: {stats[pid]['turnaround']}")
+                print(f"  Response Time  : {stats[pid]['response']}\n")
             finished += 1
 
     return events, stats
@@ -1,8 +1,11 @@
 ﻿#!/usr/bin/env python3
 
+import heapq
 import random
 import sys
 
+VERBOSE = '--verbose' in sys.argv[1:]
+
 def makeProcess():
     processes = []
     inputChoice = input("Do you want a [M]ANUAL or [R]ANDOM process generation? [M/R]: ").strip().upper()
@@ -23,56 +26,56 @@ def makeProcess():
     return processes
 
 def srtf(processes):
+    order = sorted(processes, key=lambda p: p['arrival'])
+    n = len(order)
     time = 0
     events = []
     stats = {}
     ready = []
-    remaining = {p['pid']: p['burst'] for p in processes}
-    arrived = []
+    arrivalIndex = 0
     currentProcess = None
     lastSwitch = 0
-    finished = 0
-    n = len(processes)
-
-    while finished < n:
-        for p in processes:
-            if p['arrival'] == time:
-                arrived.append(p)
-
-        ready += [p for p in arrived if p['pid'] not in [r['pid'] for r in ready]]
-        ready = [p for p in ready if remaining[p['pid']] > 0]
-
-        if ready:
-            ready.sort(key=lambda p: (remaining[p['pid']], p['arrival'], p['pid']))
-            nextProcess = ready[0]
-
-            if currentProcess is None or currentProcess['pid'] != nextProcess['pid']:
-                if currentProcess:
-                    events.append((lastSwitch, time, f"P{currentProcess['pid']}"))
-                currentProcess = nextProcess
-                lastSwitch = time
-
-                if 'startTime' not in stats.get(currentProcess['pid'], {}):
-                    if currentProcess['pid'] not in stats:
-                        stats[currentProcess['pid']] = {
-                            'arrival': currentProcess['arrival'],
-                            'burst': currentProcess['burst']
-                        }
-                    stats[currentProcess['pid']]['startTime'] = time
-
-            remaining[currentProcess['pid']] -= 1
-            time += 1
-
-            if remaining[currentProcess['pid']] == 0:
-                events.append((lastSwitch, time, f"P{currentProcess['pid']}"))
-                stats[currentProcess['pid']]['completeTime'] = time
-                stats[currentProcess['pid']]['turnaround'] = time - currentProcess['arrival']
-                stats[currentProcess['pid']]['response'] = stats[currentProcess['pid']]['startTime'] - currentProcess['arrival']
-                print(f"P{currentProcess['pid']}: ST={stats[currentProcess['pid']]['startTime']}, CT={time}, AT={currentProcess['arrival']}, RT={stats[currentProcess['pid']]['response']}, TAT={stats[currentProcess['pid']]['turnaround']}")
-                finished += 1
-                currentProcess = None
-        else:
-            time += 1
+
+    while arrivalIndex < n or ready or currentProcess is not None:
+        while arrivalIndex < n and order[arrivalIndex]['arrival'] <= time:
+            p = order[arrivalIndex]
+            heapq.heappush(ready, (p['burst'], p['arrival'], p['pid'], arrivalIndex))
+            arrivalIndex += 1
+
+        if currentProcess is None and not ready:
+            time = order[arrivalIndex]['arrival']
+            continue
+
+        if currentProcess is not None:
+            heapq.heappush(ready, currentProcess)
+        burstLeft, arrival, pid, index = heapq.heappop(ready)
+
+        if currentProcess is None or currentProcess[2] != pid:
+            if currentProcess is not None:
+                events.append((lastSwitch, time, f"P{currentProcess[2]}"))
+            lastSwitch = time
+
+            if pid not in stats:
+                stats[pid] = {
+                    'arrival': arrival,
+                    'burst': order[index]['burst'],
+                    'startTime': time
+                }
+
+        if arrivalIndex < n and time + burstLeft > order[arrivalIndex]['arrival']:
+            nextArrival = order[arrivalIndex]['arrival']
+            currentProcess = (burstLeft - (nextArrival - time), arrival, pid, index)
+            time = nextArrival
+            continue
+
+        time += burstLeft
+        events.append((lastSwitch, time, f"P{pid}"))
+        stats[pid]['completeTime'] = time
+        stats[pid]['turnaround'] = time - arrival
+        stats[pid]['response'] = stats[pid]['startTime'] - arrival
+        if VERBOSE:
+            print(f"P{pid}: ST={stats[pid]['startTime']}, CT={time}, AT={arrival}, RT={stats[pid]['response']}, TAT={stats[pid]['turnaround']}")
+        currentProcess = None
 
     return events, stats
 